@@ -4,6 +4,7 @@ Package metadata for openedx-core.
 """
 import os
 import re
+import subprocess
 import sys
 
 from setuptools import find_packages, setup
@@ -57,8 +58,8 @@ VERSION = get_version('src', 'openedx_core', '__init__.py')
 
 if sys.argv[-1] == 'tag':
     print("Tagging the version on github:")
-    os.system("git tag -a %s -m 'version %s'" % (VERSION, VERSION))
-    os.system("git push --tags")
+    subprocess.run(["git", "tag", "-a", VERSION, "-m", f"version {VERSION}"], check=True)
+    subprocess.run(["git", "push", "--tags"], check=True)
     sys.exit()
 
 README = open(os.path.join(os.path.dirname(__file__), 'README.rst')).read()
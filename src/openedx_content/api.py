@@ -7,14 +7,41 @@ re-export the public functions from all api.py modules of its applets.
 It may also implement its own convenience APIs that wrap calls to multiple app
 APIs.
 """
+import importlib
 
-# These wildcard imports are okay because these api modules declare __all__.
-# pylint: disable=wildcard-import
-from .applets.backup_restore.api import *
-from .applets.collections.api import *
-from .applets.components.api import *
-from .applets.media.api import *
-from .applets.publishing.api import *
-from .applets.sections.api import *
-from .applets.subsections.api import *
-from .applets.units.api import *
+# The applet api modules whose __all__ entries make up this module's public
+# names. They are imported lazily (PEP 562) the first time one of their names
+# is accessed, so that merely importing ``openedx_content.api`` doesn't pay
+# for loading every applet.
+_APPLET_API_MODULES = (
+    ".applets.backup_restore.api",
+    ".applets.collections.api",
+    ".applets.components.api",
+    ".applets.media.api",
+    ".applets.publishing.api",
+    ".applets.sections.api",
+    ".applets.subsections.api",
+    ".applets.units.api",
+)
+
+
+def __getattr__(name: str):
+    """
+    Resolve ``name`` from the applet api module that exports it.
+    """
+    if not name.startswith("_"):
+        for module_path in _APPLET_API_MODULES:
+            module = importlib.import_module(module_path, __package__)
+            if name in module.__all__:
+                value = getattr(module, name)
+                # Cache it so later accesses skip this function entirely.
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    names = set(globals())
+    for module_path in _APPLET_API_MODULES:
+        names.update(importlib.import_module(module_path, __package__).__all__)
+    return sorted(names)
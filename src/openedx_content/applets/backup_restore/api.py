@@ -6,7 +6,19 @@ import zipfile
 from django.contrib.auth.models import User as UserType  # pylint: disable=imported-auth-user
 
 from ..publishing.api import get_learning_package_by_key
-from .zipper import LearningPackageUnzipper, LearningPackageZipper
+
+# The public API that will be re-exported by openedx_content.api
+# is listed in the __all__ entries below.
+__all__ = [
+    "create_zip_file",
+    "load_learning_package",
+]
+
+# The .zipper module (and the tomlkit/serializer stack it drags in) is only
+# needed when a backup or restore actually runs, so it is imported inside the
+# functions below rather than making every `openedx_content.api` import pay
+# for it.
+# pylint: disable=import-outside-toplevel
 
 
 def create_zip_file(lp_key: str, path: str, user: UserType | None = None, origin_server: str | None = None) -> None:
@@ -16,6 +28,8 @@ def create_zip_file(lp_key: str, path: str, user: UserType | None = None, origin
 
     Can throw a NotFoundError at get_learning_package_by_key
     """
+    from .zipper import LearningPackageZipper
+
     learning_package = get_learning_package_by_key(lp_key)
     LearningPackageZipper(learning_package, user, origin_server).create_zip(path)
 
@@ -26,5 +40,7 @@ def load_learning_package(path: str, key: str | None = None, user: UserType | No
     Restores the learning package and its contents to the database.
     Returns a dictionary with the status of the operation and any errors encountered.
     """
+    from .zipper import LearningPackageUnzipper
+
     with zipfile.ZipFile(path, "r") as zipf:
         return LearningPackageUnzipper(zipf, key, user).load()
@@ -66,14 +66,29 @@ class ComponentSerializer(EntitySerializer):  # pylint: disable=abstract-method
         """
         Custom validation logic:
         parse the entity_key into (component_type, local_key).
+
+        Restores pass a ``component_types_cache`` dict in the serializer
+        context, keyed on (namespace, name). A restore sees the same handful
+        of component types once per component, and per the caching advice on
+        ``get_or_create_component_type``, a dict local to the run is the safe
+        way to avoid re-querying them.
         """
         entity_key = attrs["key"]
+        cache = self.context.get("component_types_cache")
+        if cache is not None:
+            parts = entity_key.split(":", 2)
+            if len(parts) == 3 and (parts[0], parts[1]) in cache:
+                attrs["component_type"] = cache[(parts[0], parts[1])]
+                attrs["local_key"] = parts[2]
+                return attrs
         try:
             component_type_obj, local_key = components_api.get_or_create_component_type_by_entity_key(entity_key)
             attrs["component_type"] = component_type_obj
             attrs["local_key"] = local_key
         except ValueError as exc:
             raise serializers.ValidationError({"key": str(exc)})
+        if cache is not None:
+            cache[(component_type_obj.namespace, component_type_obj.name)] = component_type_obj
         return attrs
 
 
@@ -192,12 +192,19 @@ class LearningPackageZipper:
                 # which is too large for this type of prefetch.
                 Prefetch(
                     "draft__version__componentversion__componentversionmedia_set",
-                    queryset=ComponentVersionMedia.objects.select_related("media"),
+                    # The zip-writing loop reads media.path, which goes through
+                    # media.learning_package.uuid, so join it here instead of
+                    # fetching one LearningPackage row per media file.
+                    queryset=ComponentVersionMedia.objects.select_related(
+                        "media__learning_package",
+                    ),
                     to_attr="prefetched_media",
                 ),
                 Prefetch(
                     "published__version__componentversion__componentversionmedia_set",
-                    queryset=ComponentVersionMedia.objects.select_related("media"),
+                    queryset=ComponentVersionMedia.objects.select_related(
+                        "media__learning_package",
+                    ),
                     to_attr="prefetched_media",
                 ),
             )
@@ -514,6 +521,10 @@ class LearningPackageUnzipper:
         self.learning_package_id: int | None = None  # Will be set upon restoration
         self.utc_now: datetime = datetime.now(timezone.utc)
         self.component_types_cache: dict[tuple[str, str], ComponentType] = {}
+        # Per-restore memo of MediaType ids, as recommended by the caching
+        # warning on media_api.get_or_create_media_type: restores hit the same
+        # handful of mime types once per component otherwise.
+        self.media_type_ids_cache: dict[str, int] = {}
         self.errors: list[dict[str, Any]] = []
         # Maps for resolving relationships
         self.components_map_by_key: dict[str, Any] = {}
@@ -669,7 +680,10 @@ class LearningPackageUnzipper:
 
             entity_data, draft_version, published_version = self._load_entity_data(file)
             serializer = entity_serializer(
-                data={"created": self.utc_now, "created_by": None, **entity_data}
+                data={"created": self.utc_now, "created_by": None, **entity_data},
+                # Lets ComponentSerializer reuse ComponentTypes already
+                # fetched during this restore; other serializers ignore it.
+                context={"component_types_cache": self.component_types_cache},
             )
 
             if not serializer.is_valid():
@@ -797,7 +811,9 @@ class LearningPackageUnzipper:
                 (entity_key, version_num)
             )  # Track published version
             components_api.create_next_component_version(
-                self.components_map_by_key[entity_key].publishable_entity.id,
+                # Use the stored FK value; going through .publishable_entity
+                # would fetch the PublishableEntity row for every component.
+                self.components_map_by_key[entity_key].publishable_entity_id,
                 media_to_replace=media_to_replace,
                 force_version_num=valid_published.pop("version_num", None),
                 created_by=self.user_id,
@@ -878,7 +894,7 @@ class LearningPackageUnzipper:
                 continue
             media_to_replace = self._resolve_static_files(version_num, entity_key, component_static_files)
             components_api.create_next_component_version(
-                self.components_map_by_key[entity_key].publishable_entity.id,
+                self.components_map_by_key[entity_key].publishable_entity_id,
                 media_to_replace=media_to_replace,
                 force_version_num=valid_draft.pop("version_num", None),
                 # Drafts can diverge from published, so we allow ignoring previous media
@@ -987,7 +1003,7 @@ class LearningPackageUnzipper:
                     raise ValueError("learning_package_id must be set before resolving static files.")
                 text_media = media_api.get_or_create_text_media(
                     self.learning_package_id,
-                    media_api.get_or_create_media_type(f"application/vnd.openedx.xblock.v1.{block_type}+xml").id,
+                    self._media_type_id(f"application/vnd.openedx.xblock.v1.{block_type}+xml"),
                     text=media_bytes.decode("utf-8"),
                     created=self.utc_now,
                 )
@@ -996,6 +1012,14 @@ class LearningPackageUnzipper:
                 resolved_files[local_key] = media_bytes
         return resolved_files
 
+    def _media_type_id(self, mime_type: str) -> int:
+        """Get (or create) the MediaType id for a mime type, memoized per restore."""
+        media_type_id = self.media_type_ids_cache.get(mime_type)
+        if media_type_id is None:
+            media_type_id = media_api.get_or_create_media_type(mime_type).id
+            self.media_type_ids_cache[mime_type] = media_type_id
+        return media_type_id
+
     def _resolve_children(self, entity_data: dict[str, Any], lookup_map: dict[str, Any]) -> list[Any]:
         """Resolve child entity keys into model instances."""
         children_keys = entity_data.pop("children", [])
@@ -1052,19 +1076,24 @@ class LearningPackageUnzipper:
                 continue
             if path == TOML_PACKAGE_NAME:
                 organized["learning_package"] = path
-            elif path.startswith("entities/") and str(Path(path).parent) == "entities" and path.endswith(".toml"):
-                # Top-level entity TOML files are considered containers
-                organized["containers"].append(path)
             elif path.startswith("entities/"):
+                # Zip entry names always use "/", so one split is enough to
+                # classify the path. (This loop runs for every file in the
+                # archive, so avoid building Path objects per entry.)
+                parts = path.split("/")
                 if path.endswith(".toml"):
-                    # Component entity TOML files
-                    organized["components"].append(path)
+                    if len(parts) == 2:
+                        # Top-level entity TOML files are considered containers
+                        organized["containers"].append(path)
+                    else:
+                        # Component entity TOML files
+                        organized["components"].append(path)
                 else:
                     # Component static files
                     # Path structure: entities/<namespace>/<type>/<component_id>/component_versions/<version>/static/...
                     # Example: entities/xblock.v1/html/my_component_123456/component_versions/v1/static/...
-                    component_key = Path(path).parts[1:4]  # e.g., ['xblock.v1', 'html', 'my_component_123456']
-                    num_version = Path(path).parts[5] if len(Path(path).parts) > 5 else "v1"  # e.g., 'v1'
+                    component_key = parts[1:4]  # e.g., ['xblock.v1', 'html', 'my_component_123456']
+                    num_version = parts[5] if len(parts) > 5 else "v1"  # e.g., 'v1'
                     if len(component_key) == 3:
                         component_identifier = ":".join(component_key)
                         component_identifier += f":{num_version}"
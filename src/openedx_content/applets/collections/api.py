@@ -73,17 +73,19 @@ def update_collection(
     """
     collection = get_collection(learning_package_id, key)
 
-    # If no changes were requested, there's nothing to update, so just return
-    # the Collection as-is
-    if all(field is None for field in [title, description]):
-        return collection
-
-    if title is not None:
+    # Compare against the values we just loaded, so that a redundant update
+    # (no requested changes, or changes that match what's already stored)
+    # doesn't cost a write or bump `modified`.
+    changed_fields = []
+    if title is not None and title != collection.title:
         collection.title = title
-    if description is not None:
+        changed_fields.append("title")
+    if description is not None and description != collection.description:
         collection.description = description
+        changed_fields.append("description")
 
-    collection.save()
+    if changed_fields:
+        collection.save(update_fields=changed_fields + ["modified"])
     return collection
 
 
@@ -223,7 +225,7 @@ def set_collections(
     Returns the updated collections.
     """
     # Disallow adding entities outside the collection's learning package
-    if collection_qset.exclude(learning_package_id=publishable_entity.learning_package_id).count():
+    if collection_qset.exclude(learning_package_id=publishable_entity.learning_package_id).exists():
         raise ValidationError(
             "Collection entities must be from the same learning package as the collection.",
         )
@@ -68,6 +68,7 @@ from __future__ import annotations
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Now
 from django.utils.translation import gettext_lazy as _
 
 from openedx_django_lib.fields import MultiCollationTextField, case_insensitive_char_field, key_field
@@ -184,6 +185,13 @@ class Collection(models.Model):
                 fields=["learning_package", "title"],
                 name="openedx_content_coll_lp_title",
             ),
+            # Covers the common "enabled collections in this package" listing
+            # (see get_collections), so it doesn't have to filter rows fetched
+            # via the learning_package FK index.
+            models.Index(
+                fields=["learning_package", "enabled"],
+                name="openedx_content_coll_lp_on",
+            ),
         ]
 
     def __repr__(self) -> str:
@@ -217,11 +225,15 @@ class CollectionPublishableEntity(models.Model):
         null=True,
         blank=True,
     )
+    # The database assigns this timestamp (rather than auto_now_add calling
+    # timezone.now() per instance in Python): these rows are created in bulk
+    # when entities are added to a collection, so rows inserted in the same
+    # statement share one consistent time and need no per-row Python work.
+    # (Collection.created stays on the Python clock because it's paired with
+    # an auto_now modified field, and the two should agree on creation.)
     created = models.DateTimeField(
-        auto_now_add=True,
-        validators=[
-            validate_utc_datetime,
-        ],
+        db_default=Now(),
+        editable=False,
     )
 
     class Meta:
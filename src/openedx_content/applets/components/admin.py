@@ -1,7 +1,7 @@
 """
 Django admin for components models
 """
-import base64
+from functools import lru_cache
 
 from django.contrib import admin
 from django.template.defaultfilters import filesizeformat
@@ -11,14 +11,30 @@ from django.utils.safestring import SafeText
 
 from openedx_django_lib.admin_utils import ReadOnlyModelAdmin
 
+from ..media.admin import base64_data_for_media
 from .models import Component, ComponentVersion, ComponentVersionMedia
 
 
+@lru_cache(maxsize=1)
+def _component_version_change_url_template() -> str:
+    """
+    The ComponentVersion change-page URL with a ``{}`` placeholder for the pk.
+
+    ``reverse()`` walks the URL resolver on every call, which adds up when a
+    Component has many versions, so resolve it once (lazily, since the URLconf
+    isn't loaded at import time) and substitute the pk per row.
+    """
+    return reverse(
+        "admin:openedx_content_componentversion_change", args=(0,)
+    ).replace("/0/", "/{}/")
+
+
 class ComponentVersionInline(admin.TabularInline):
     """
     Inline admin view of ComponentVersion from the Component Admin
     """
     model = ComponentVersion
+    ordering = ["-publishable_entity_version__version_num"]  # Newest first
     fields = ["version_num", "created", "title", "format_uuid"]
     readonly_fields = ["version_num", "created", "title", "uuid", "format_uuid"]
     extra = 0
@@ -27,7 +43,7 @@ class ComponentVersionInline(admin.TabularInline):
     def format_uuid(self, cv_obj):
         return format_html(
             '<a href="{}">{}</a>',
-            reverse("admin:openedx_content_componentversion_change", args=(cv_obj.pk,)),
+            _component_version_change_url_template().format(cv_obj.pk),
             cv_obj.uuid,
         )
 
@@ -49,6 +65,12 @@ class ComponentAdmin(ReadOnlyModelAdmin):
     search_fields = ["publishable_entity__uuid", "publishable_entity__key"]
     inlines = [ComponentVersionInline]
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The key, uuid, and created columns all read from publishable_entity,
+        # and the component_type column is its own FK.
+        return queryset.select_related("publishable_entity", "component_type")
+
 
 class ContentInline(admin.TabularInline):
     """
@@ -58,14 +80,16 @@ class ContentInline(admin.TabularInline):
 
     def get_queryset(self, request):
         queryset = super().get_queryset(request)
+        # Only join the tables the inline actually renders: format_size reads
+        # media.size, and media_preview reads media.media_type and (via
+        # Media.path) media.learning_package.uuid. The component_version side
+        # is the inline's parent object, which the admin already has, so
+        # joining it (and its publishable entity relations) onto every row
+        # just makes the rows wider.
         return queryset.select_related(
             "media",
             "media__learning_package",
             "media__media_type",
-            "component_version",
-            "component_version__publishable_entity_version",
-            "component_version__component",
-            "component_version__component__publishable_entity",
         )
 
     fields = [
@@ -120,6 +144,9 @@ class ComponentVersionAdmin(ReadOnlyModelAdmin):
         return queryset.select_related(
             "component",
             "component__publishable_entity",
+            # The component column renders Component.__str__, which reads
+            # component_type, so join it rather than fetching it per row:
+            "component__component_type",
             "publishable_entity_version",
         )
 
@@ -146,11 +173,10 @@ def media_preview(cvm_obj: ComponentVersionMedia) -> SafeText:
         # have them without creating a separate view in Open edX Core. (Keep in
         # mind that these assets are private, so they cannot be accessed via the
         # MEDIA_URL like most Django uploaded assets.)
-        data = media_obj.read_file().read()
         return format_html(
             '<img src="data:{};base64, {}" style="max-width: 100%;" /><br><pre>{}</pre>',
             media_obj.mime_type,
-            base64.encodebytes(data).decode('utf8'),
+            base64_data_for_media(media_obj),
             media_obj.os_path(),
         )
 
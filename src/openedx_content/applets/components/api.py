@@ -243,6 +243,10 @@ def create_next_component_version(
             publishable_entity_version=publishable_entity_version,
             component_id=component_pk,
         )
+        # Collect all the key->Media mappings for the new version and write
+        # them in one bulk_create at the end, instead of one INSERT per key.
+        cvm_to_create = []
+
         # First copy the new stuff over...
         for key, media_pk_or_bytes in media_to_replace.items():
             # If the media_pk is None, it means we want to remove the
@@ -257,7 +261,7 @@ def create_next_component_version(
                     media_type_str = media_type_str or "application/octet-stream"
                     media_type = media_api.get_or_create_media_type(media_type_str)
                     media = media_api.get_or_create_file_media(
-                        component.learning_package.id,
+                        component.learning_package_id,
                         media_type.id,
                         data=file_media,
                         created=created,
@@ -265,26 +269,27 @@ def create_next_component_version(
                     media_pk = media.pk
                 else:
                     media_pk = media_pk_or_bytes
-                ComponentVersionMedia.objects.create(
+                cvm_to_create.append(ComponentVersionMedia(
                     media_id=media_pk,
                     component_version=component_version,
                     key=key,
-                )
-
-        if ignore_previous_media:
-            return component_version
-
-        # Now copy any old associations that existed, as long as they aren't
-        # in conflict with the new stuff or marked for deletion.
-        last_version_media_mapping = ComponentVersionMedia.objects \
-                                                          .filter(component_version=last_version)
-        for cvrc in last_version_media_mapping:
-            if cvrc.key not in media_to_replace:
-                ComponentVersionMedia.objects.create(
-                    media_id=cvrc.media_id,
-                    component_version=component_version,
-                    key=cvrc.key,
-                )
+                ))
+
+        if not ignore_previous_media:
+            # Now copy any old associations that existed, as long as they aren't
+            # in conflict with the new stuff or marked for deletion.
+            last_version_media_mapping = ComponentVersionMedia.objects \
+                                                              .filter(component_version=last_version)
+            for cvrc in last_version_media_mapping:
+                if cvrc.key not in media_to_replace:
+                    cvm_to_create.append(ComponentVersionMedia(
+                        media_id=cvrc.media_id,
+                        component_version=component_version,
+                        key=cvrc.key,
+                    ))
+
+        if cvm_to_create:
+            ComponentVersionMedia.objects.bulk_create(cvm_to_create)
 
         return component_version
 
@@ -621,7 +626,15 @@ def get_redirect_response_for_component_asset(
 
     # Check: Does the ComponentVersion have the requested asset (Media)?
     try:
-        cv_media = component_version.componentversionmedia_set.get(key=asset_path)
+        # One query for the through row, the Media, and the relations the
+        # header/path code below reads (media_type for Content-Type,
+        # learning_package for media.path), instead of one round-trip each.
+        # The text column (up to 50K characters for inline content) is never
+        # read when serving an asset, so don't ship it from the database:
+        cv_media = component_version.componentversionmedia_set \
+                                    .select_related("media__media_type", "media__learning_package") \
+                                    .defer("media__text") \
+                                    .get(key=asset_path)
     except ComponentVersionMedia.DoesNotExist:
         logger.error(f"ComponentVersion {component_version_uuid} has no asset {asset_path}")
         info_headers.update(
@@ -2,14 +2,63 @@
 Django admin for media.models
 """
 import base64
+import mmap
 
 from django.contrib import admin
+from django.core.cache import cache
 from django.utils.html import format_html
 
 from openedx_django_lib.admin_utils import ReadOnlyModelAdmin
 
 from .models import Media
 
+# Don't cache encoded previews for files bigger than this, so that a page of
+# large images can't crowd everything else out of the cache.
+MAX_CACHED_PREVIEW_SIZE = 1_000_000
+
+
+def base64_data_for_media(media: Media) -> str:
+    """
+    Base64-encoded file data for the given Media, cached by content hash.
+
+    The encoded string is a pure function of the file's bytes, and
+    ``hash_digest`` identifies those bytes, so admin page loads can reuse
+    previously encoded previews instead of re-reading and re-encoding the
+    file every time.
+    """
+    if media.size > MAX_CACHED_PREVIEW_SIZE:
+        return _encode_media_file(media)
+    encoded = cache.get_or_set(
+        f"media_preview_b64:{media.hash_digest}",
+        lambda: _encode_media_file(media),
+        timeout=60 * 60 * 24,
+    )
+    assert encoded is not None  # get_or_set only returns None when the default is None
+    return encoded
+
+
+def _encode_media_file(media: Media) -> str:
+    """
+    Base64-encode the file bytes for the given Media.
+
+    When the file is on a local disk, encode straight from an mmap of it:
+    b64encode accepts any buffer, so this skips materializing the whole file
+    as an intermediate bytes object. Remote storage backends (and empty
+    files, which mmap rejects) fall back to reading the file normally.
+    """
+    os_path = media.os_path()
+    if os_path and media.size:
+        try:
+            f = open(os_path, "rb")
+        except OSError:
+            # Some storage backends (e.g. InMemoryStorage) implement path()
+            # without putting a real file on disk; fall through to read_file().
+            pass
+        else:
+            with f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode("utf8")
+    return base64.b64encode(media.read_file().read()).decode("utf8")
+
 
 @admin.register(Media)
 class ContentAdmin(ReadOnlyModelAdmin):
@@ -39,6 +88,13 @@ class ContentAdmin(ReadOnlyModelAdmin):
     list_filter = ("media_type", "learning_package")
     search_fields = ("hash_digest",)
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The learning_package column reads the related row for every Media in
+        # the list view, and the (up to 50K character) text column is only
+        # shown on the detail page, so don't drag it along for the list.
+        return queryset.select_related("learning_package").defer("text")
+
     @admin.display(description="OS Path")
     def os_path(self, media: Media):
         return media.os_path() or ""
@@ -63,9 +119,8 @@ class ContentAdmin(ReadOnlyModelAdmin):
         if media.media_type.type != "image":
             return ""
 
-        data = media.read_file().read()
         return format_html(
             '<img src="data:{};base64, {}" style="max-width: 100%;" />',
             media.mime_type,
-            base64.encodebytes(data).decode('utf8'),
+            base64_data_for_media(media),
         )
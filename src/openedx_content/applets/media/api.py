@@ -7,6 +7,7 @@ are stored in this app.
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from logging import getLogger
 
 from django.core.files.base import ContentFile
@@ -49,15 +50,10 @@ def get_or_create_media_type(mime_type: str) -> MediaType:
     could leak out in the event of a rollback–e.g. new types are introduced in
     a large import transaction which later fails. You can safely cache the
     results that come back from this function with a local dict in your import
-    process instead.
+    process instead. (The mime *string parsing* below is cached, since it's a
+    pure function of its input; only the database lookup must stay uncached.)
     """
-    if "+" in mime_type:
-        base, suffix = mime_type.split("+")
-    else:
-        base = mime_type
-        suffix = ""
-
-    main_type, sub_type = base.split("/")
+    main_type, sub_type, suffix = _parse_mime_type(mime_type)
     media_type, _created = MediaType.objects.get_or_create(
         type=main_type,
         sub_type=sub_type,
@@ -67,6 +63,26 @@ def get_or_create_media_type(mime_type: str) -> MediaType:
     return media_type
 
 
+@lru_cache(maxsize=256)
+def _parse_mime_type(mime_type: str) -> tuple[str, str, str]:
+    """
+    Split a mime string into its (main type, sub type, suffix) parts.
+
+    Bulk flows like restores call get_or_create_media_type once per file, and
+    a given import uses a small set of distinct mime strings, so memoize the
+    parse. Unlike the MediaType row itself, this is safe to cache: it depends
+    only on the input string.
+    """
+    if "+" in mime_type:
+        base, suffix = mime_type.split("+")
+    else:
+        base = mime_type
+        suffix = ""
+
+    main_type, sub_type = base.split("/")
+    return main_type, sub_type, suffix
+
+
 def get_media(media_id: int, /) -> Media:
     """
     Get a single Media object by its ID.
@@ -250,7 +250,11 @@ class Media(models.Model):
     # This is the size of the file in bytes. This can be different than the
     # character length of a text file, since UTF-8 encoding can use anywhere
     # between 1-4 bytes to represent any given character.
-    size = models.PositiveBigIntegerField(
+    #
+    # A 4-byte integer comfortably holds MAX_FILE_SIZE (and anything short of
+    # 2GB), and we expect many millions of Media rows, so there's no reason to
+    # pay for an 8-byte column here.
+    size = models.PositiveIntegerField(
         validators=[MaxValueValidator(MAX_FILE_SIZE)],
     )
 
@@ -3,10 +3,8 @@ Django admin for publishing models
 """
 from __future__ import annotations
 
-import functools
-
 from django.contrib import admin
-from django.db.models import Count, F
+from django.db.models import Count, F, Prefetch
 from django.utils.html import format_html
 from django.utils.safestring import SafeText
 
@@ -38,6 +36,11 @@ class LearningPackageAdmin(ReadOnlyModelAdmin):
     list_display = ["key", "title", "uuid", "created", "updated"]
     search_fields = ["key", "title", "uuid"]
 
+    def get_queryset(self, request):
+        # The changelist never renders the description (which can be up to
+        # 10,000 characters), so don't ship it from the database per row.
+        return super().get_queryset(request).defer("description")
+
 
 class PublishLogRecordTabularInline(admin.TabularInline):
     """
@@ -90,6 +93,10 @@ class PublishLogAdmin(ReadOnlyModelAdmin):
     list_display = fields
     list_filter = ["learning_package"]
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        return queryset.select_related("learning_package", "published_by")
+
 
 class PublishableEntityVersionTabularInline(admin.TabularInline):
     """
@@ -350,11 +357,15 @@ class DraftChangeSetAdmin(ReadOnlyModelAdmin):
                        .annotate(num_changes=Count("records"))
 
 
-def _entity_list_detail_link(el: EntityList) -> SafeText:
+def _entity_list_detail_link(el: EntityList, num_rows: int | None = None) -> SafeText:
     """
     A link to the detail page for an EntityList which includes its PK and length.
+
+    Callers that render many of these links can pass ``num_rows`` from an
+    annotation on their own queryset instead of paying a COUNT query per link.
     """
-    num_rows = el.entitylistrow_set.count()
+    if num_rows is None:
+        num_rows = el.entitylistrow_set.count()
     rows_noun = "row" if num_rows == 1 else "rows"
     return model_detail_link(el, f"EntityList #{el.pk} with {num_rows} {rows_noun}")
 
@@ -377,12 +388,22 @@ class ContainerVersionInlineForContainer(admin.TabularInline):
     extra = 0
 
     def get_queryset(self, request):
+        # The children column reads entity_list, and the created_by column
+        # reads publishable_entity_version.created_by, so join both here
+        # rather than querying them once per inline row. The row count for
+        # each entity list is annotated for the same reason: counting in the
+        # inline query beats a COUNT per rendered link.
         return super().get_queryset(request).select_related(
-            "publishable_entity_version"
+            "publishable_entity_version__created_by",
+            "entity_list",
+        ).annotate(
+            entity_list_row_count=Count("entity_list__entitylistrow"),
         )
 
     def children(self, obj: ContainerVersion):
-        return _entity_list_detail_link(obj.entity_list)
+        # entity_list_row_count is annotated onto the queryset above, so it isn't on the model type.
+        num_rows = obj.entity_list_row_count  # type: ignore[attr-defined]
+        return _entity_list_detail_link(obj.entity_list, num_rows=num_rows)
 
 
 @admin.register(Container)
@@ -475,7 +496,9 @@ class ContainerVersionInlineForEntityList(admin.TabularInline):
         return super().get_queryset(request).select_related(
             "container",
             "container__publishable_entity",
-            "publishable_entity_version",
+            # created_by reads through publishable_entity_version, so pull
+            # the user row along in the same join:
+            "publishable_entity_version__created_by",
         )
 
     def container_key(self, obj: ContainerVersion) -> SafeText:
@@ -487,6 +510,7 @@ class EntityListRowInline(admin.TabularInline):
     Table of entity rows in the entitylist admin
     """
     model = EntityListRow
+    ordering = ["order_num"]  # EntityListRow has no default ordering
     readonly_fields = [
         "order_num",
         "pinned_version_num",
@@ -552,11 +576,31 @@ class EntityListAdmin(ReadOnlyModelAdmin):
     ]
     inlines = [ContainerVersionInlineForEntityList, EntityListRowInline]
 
+    def get_queryset(self, request):
+        # Prefetch the ContainerVersions (and the relations the changelist
+        # columns render) so that _latest_container_version doesn't have to
+        # issue a query per row. The row count is annotated for the same
+        # reason: counting in the changelist query beats a COUNT per row.
+        return super().get_queryset(request).annotate(
+            entity_list_row_count=Count("entitylistrow"),
+        ).prefetch_related(
+            Prefetch(
+                "container_versions",
+                queryset=ContainerVersion.objects.order_by("-pk").select_related(
+                    "publishable_entity_version",
+                    "container__publishable_entity__learning_package",
+                ),
+                to_attr="prefetched_container_versions",
+            ),
+        )
+
     def entity_list(self, obj: EntityList) -> SafeText:
         return model_detail_link(obj, f"EntityList #{obj.pk}")
 
+    @admin.display(ordering="entity_list_row_count")
     def row_count(self, obj: EntityList) -> int:
-        return obj.entitylistrow_set.count()
+        # Annotated onto the changelist queryset, so it isn't on the model type.
+        return obj.entity_list_row_count  # type: ignore[attr-defined]
 
     def recent_container_version_num(self, obj: EntityList) -> str:
         """
@@ -600,7 +644,6 @@ class EntityListAdmin(ReadOnlyModelAdmin):
     recent_container_package.short_description = ""  # type: ignore[attr-defined]
 
 
-@functools.cache
 def _latest_container_version(obj: EntityList) -> ContainerVersion | None:
     """
     Any given EntityList can be used by multiple ContainerVersion (which may even
@@ -608,4 +651,11 @@ def _latest_container_version(obj: EntityList) -> ContainerVersion | None:
     easily, so let's show the one that's most likely to be interesting to the Django
     admin user: the most-recently-created one.
     """
+    # The changelist prefetches these (see EntityListAdmin.get_queryset), both
+    # to avoid a query per row and so that the three columns that call this
+    # helper per row don't each re-run that query.
+    if hasattr(obj, "prefetched_container_versions"):
+        if obj.prefetched_container_versions:
+            return obj.prefetched_container_versions[0]
+        return None
     return obj.container_versions.order_by("-pk").first()
@@ -75,6 +75,7 @@ __all__ = [
     "soft_delete_draft",
     "reset_drafts_to_published",
     "register_publishable_models",
+    "register_publishable_models_lazy",
     "filter_publishable_entities",
     # 🛑 UNSTABLE: All APIs related to containers are unstable until we've figured
     #              out our approach to dynamic content (randomized, A/B tests, etc.)
@@ -156,25 +157,30 @@ def update_learning_package(
     """
     lp = LearningPackage.objects.get(id=learning_package_id)
 
-    # If no changes were requested, there's nothing to update, so just return
-    # the LearningPackage as-is.
-    if all(field is None for field in [key, title, description, updated]):
-        return lp
-
-    if key is not None:
+    # Compare against the values we just loaded, so that a redundant update
+    # (no requested changes, or changes that match what's already stored)
+    # doesn't cost a write.
+    changed = False
+    if key is not None and key != lp.key:
         lp.key = key
-    if title is not None:
+        changed = True
+    if title is not None and title != lp.title:
         lp.title = title
-    if description is not None:
+        changed = True
+    if description is not None and description != lp.description:
         lp.description = description
-
-    # updated is a bit different–we auto-generate it if it's not explicitly
-    # passed in.
-    if updated is None:
-        updated = datetime.now(tz=timezone.utc)
-    lp.updated = updated
-
-    lp.save()
+        changed = True
+
+    # updated is a bit different–an explicit value is always written, but we
+    # only auto-generate one if some other field actually changed.
+    if updated is not None:
+        lp.updated = updated
+        changed = True
+    elif changed:
+        lp.updated = datetime.now(tz=timezone.utc)
+
+    if changed:
+        lp.save()
     return lp
 
 
@@ -854,6 +860,12 @@ def _create_side_effects_for_change_log(change_log: DraftChangeLog | PublishLog)
         # all up in a list so we can do a bulk_update on them.
         branch_objs_to_update_with_side_effects = []
 
+        # (cause, effect) side-effect rows are collected here and inserted in
+        # one bulk_create below, rather than one get_or_create round-trip per
+        # affected entity.
+        side_effects_to_create = []
+        side_effect_pairs_seen = set()
+
         while changes_and_affected:
             change, affected = changes_and_affected.pop()
             change_log_param = {}
@@ -911,10 +923,13 @@ def _create_side_effects_for_change_log(change_log: DraftChangeLog | PublishLog)
             #    as the new version of the child component). The version of the
             #    Unit will be incremented, but we'll also create the
             #    DraftSideEffect.
-            side_effect_cls.objects.get_or_create(
-                cause=change,
-                effect=side_effect_change,
-            )
+            if (change.pk, side_effect_change.pk) not in side_effect_pairs_seen:
+                side_effect_pairs_seen.add((change.pk, side_effect_change.pk))
+                side_effects_to_create.append(
+                    # Like bulk_create below: change/side_effect_change always match
+                    # side_effect_cls's branch, but mypy can't narrow the union per branch.
+                    side_effect_cls(cause=change, effect=side_effect_change)  # type: ignore[misc]
+                )
 
             # Now we find the next layer up by looking at Drafts or Published
             # that have ``affected.entity`` as a dependency.
@@ -932,6 +947,13 @@ def _create_side_effects_for_change_log(change_log: DraftChangeLog | PublishLog)
                 if affected.entity_id not in processed_entity_ids
             )
 
+        # ignore_conflicts makes this as idempotent as the old per-pair
+        # get_or_create: (cause, effect) has a unique constraint, so re-running
+        # for the same change log just skips the rows that already exist.
+        side_effect_cls.objects.bulk_create(
+            side_effects_to_create,  # type: ignore[arg-type]
+            ignore_conflicts=True,
+        )
         branch_cls.objects.bulk_update(
             branch_objs_to_update_with_side_effects,  # type: ignore[arg-type]
             [log_record_rel],
@@ -1005,9 +1027,11 @@ def update_dependencies_hash_digests_for_log(
 
         # Now check to see if the new version has "live" dependencies, i.e.
         # dependencies that have not been deleted.
+        # Fetch the branch relation once per entity: hasattr() followed by
+        # getattr() would run the reverse one-to-one descriptor twice.
         deps = list(
             entity for entity in record.new_version.dependencies.all()
-            if hasattr(entity, branch) and getattr(entity, branch).version
+            if (branch_rel := getattr(entity, branch, None)) and branch_rel.version
         )
 
         # If there are no live dependencies, this log record also gets the
@@ -1161,7 +1185,7 @@ def hash_for_log_record(
             return ''
         deps = list(
             entity for entity in record.new_version.dependencies.all()
-            if hasattr(entity, branch) and getattr(entity, branch).version
+            if (branch_rel := getattr(entity, branch, None)) and branch_rel.version
         )
         # If there are no live dependencies, this log record also gets the
         # default/blank value.
@@ -1179,9 +1203,10 @@ def hash_for_log_record(
     )
     dep_state_entries = []
     for dep_entity in dependencies:
-        new_version_id = getattr(dep_entity, branch).log_record.new_version_id
+        dep_log_record = getattr(dep_entity, branch).log_record
+        new_version_id = dep_log_record.new_version_id
         hash_digest = hash_for_log_record(
-            getattr(dep_entity, branch).log_record,
+            dep_log_record,
             record_ids_to_hash_digests,
             record_ids_to_live_deps,
             untrusted_record_id_set,
@@ -1317,6 +1342,31 @@ def register_publishable_models(
     )
 
 
+def register_publishable_models_lazy(
+    content_model_label: str,
+    content_version_model_label: str,
+) -> None:
+    """
+    Register a content model -> content version model pairing by model label.
+
+    This does the same thing as ``register_publishable_models``, but takes
+    "app_label.ModelName" strings and defers resolving them into model classes
+    until the registry is first read. Use this from your app's
+    AppConfig.ready() method to avoid importing your model classes (and
+    everything they pull in) during Django startup:
+
+        def ready(self):
+            from ..publishing.api import register_publishable_models_lazy
+
+            register_publishable_models_lazy(
+                "openedx_content.Component", "openedx_content.ComponentVersion"
+            )
+    """
+    PublishableContentModelRegistry.register_lazy(
+        content_model_label, content_version_model_label
+    )
+
+
 def filter_publishable_entities(
     entities: QuerySet[PublishableEntity],
     has_draft=None,
@@ -1758,11 +1808,14 @@ def get_collection_containers(
     ).order_by('pk')
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContainerEntityListEntry:
     """
     [ 🛑 UNSTABLE ]
     Data about a single entity in a container, e.g. a component in a unit.
+
+    We create one of these per row when listing container contents, so use
+    slots to skip the per-instance ``__dict__`` allocation.
     """
     entity_version: PublishableEntityVersion
     pinned: bool
@@ -271,7 +271,10 @@ class DraftChangeLogRecord(models.Model):
     #
     # Note: There is an equivalent of this field in the Published model and the
     # the values may drift away from each other.
-    dependencies_hash_digest = hash_field(blank=True, default='', max_length=8)
+    # db_default (rather than a Python-side default) so that writes that
+    # bypass the ORM's field defaults (raw SQL, backfills) get the same
+    # blank value.
+    dependencies_hash_digest = hash_field(blank=True, db_default='', max_length=8)
 
     class Meta:
         constraints = [
@@ -80,7 +80,11 @@ class EntityListRow(models.Model):
         return self.entity_version_id is None
 
     class Meta:
-        ordering = ["order_num"]
+        # No default ordering: callers that care about list order (the
+        # ``EntityList.rows`` property and the container APIs) already use an
+        # explicit ``order_by("order_num")``, and a Meta default would tack an
+        # ORDER BY onto counts, aggregates, and other queries that don't need
+        # one.
         constraints = [
             # If (entity_list, order_num) is not unique, it likely indicates a race condition - so force uniqueness.
             models.UniqueConstraint(
@@ -7,6 +7,7 @@ from datetime import datetime
 from functools import cached_property
 from typing import ClassVar, Self
 
+from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.core.validators import MinValueValidator
@@ -452,6 +453,10 @@ class PublishableEntityMixin(models.Model):
                     # Example: self.related_name = "containerversion.unitversion"
                     self.related_name = self.related_name + "." + field_to_intermediate.related_query_name()
 
+            # Split once here rather than on every _content_obj_version call,
+            # since that runs per entity when assembling container contents.
+            self._related_name_path = tuple(self.related_name.split("."))
+
         def _content_obj_version(self, pub_ent_version: PublishableEntityVersion | None):
             """
             PublishableEntityVersion -> Content object version
@@ -462,7 +467,7 @@ class PublishableEntityMixin(models.Model):
             if pub_ent_version is None:
                 return None
             obj = pub_ent_version
-            for field_name in self.related_name.split("."):
+            for field_name in self._related_name_path:
                 obj = getattr(obj, field_name)
             return obj
 
@@ -651,6 +656,10 @@ class PublishableContentModelRegistry:
     _unversioned_to_versioned: dict[type[PublishableEntityMixin], type[PublishableEntityVersionMixin]] = {}
     _versioned_to_unversioned: dict[type[PublishableEntityVersionMixin], type[PublishableEntityMixin]] = {}
 
+    # Pairings registered by "app_label.ModelName" strings, not yet resolved to
+    # model classes. See register_lazy().
+    _pending_registrations: ClassVar[list[tuple[str, str]]] = []
+
     @classmethod
     def register(
         cls,
@@ -676,10 +685,39 @@ class PublishableContentModelRegistry:
         cls._unversioned_to_versioned[content_model_cls] = content_version_model_cls
         cls._versioned_to_unversioned[content_version_model_cls] = content_model_cls
 
+    @classmethod
+    def register_lazy(cls, content_model_label: str, content_version_model_label: str):
+        """
+        Register a content model -> content version model pairing by model label.
+
+        Labels are "app_label.ModelName" strings, e.g. "openedx_content.Component".
+        They are only resolved into model classes the first time the registry is
+        read, so an app can call this from AppConfig.ready() without importing
+        its model classes (and everything they import) during startup.
+        """
+        cls._pending_registrations.append(
+            (content_model_label, content_version_model_label)
+        )
+
+    @classmethod
+    def _resolve_pending_registrations(cls):
+        """
+        Resolve any label pairings added by register_lazy() into model classes.
+        """
+        if cls._pending_registrations:
+            pending, cls._pending_registrations = cls._pending_registrations, []
+            for content_model_label, content_version_model_label in pending:
+                cls.register(
+                    apps.get_model(content_model_label),
+                    apps.get_model(content_version_model_label),
+                )
+
     @classmethod
     def get_versioned_model_cls(cls, content_model_cls):
+        cls._resolve_pending_registrations()
         return cls._unversioned_to_versioned[content_model_cls]
 
     @classmethod
     def get_unversioned_model_cls(cls, content_version_model_cls):
+        cls._resolve_pending_registrations()
         return cls._versioned_to_unversioned[content_version_model_cls]
@@ -242,7 +242,7 @@ def get_latest_section_version(section_pk: int) -> SectionVersion:
     return Section.objects.get(pk=section_pk).versioning.latest
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SectionListEntry:
     """
     [ 🛑 UNSTABLE ]
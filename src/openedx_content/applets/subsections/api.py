@@ -241,7 +241,7 @@ def get_latest_subsection_version(subsection_pk: int) -> SubsectionVersion:
     return Subsection.objects.get(pk=subsection_pk).versioning.latest
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SubsectionListEntry:
     """
     [ 🛑 UNSTABLE ]
@@ -39,6 +39,11 @@ class UnitAdmin(ReadOnlyModelAdmin):
     fields = ["key"]
     readonly_fields = ["key"]
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        # The key column reads publishable_entity.key for every row.
+        return queryset.select_related("publishable_entity")
+
     def key(self, obj: Unit) -> SafeText:
         return model_detail_link(obj.container, obj.key)
 
@@ -242,7 +242,7 @@ def get_latest_unit_version(unit_pk: int) -> UnitVersion:
     return Unit.objects.get(pk=unit_pk).versioning.latest
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnitListEntry:
     """
     [ 🛑 UNSTABLE ]
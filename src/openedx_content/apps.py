@@ -23,25 +23,21 @@ class ContentConfig(AppConfig):
     def register_publishable_models(self):
         """
         Register all Publishable -> Version model pairings in our app.
+
+        We register these by label so that startup doesn't pay for importing
+        our top-level models (and api) modules; the labels are resolved into
+        model classes the first time the publishable-models registry is read.
+        The registry is imported from its models module directly (Django has
+        already loaded the models by the time ready() runs) so that startup
+        doesn't import the publishing api module either.
         """
-        from .api import register_publishable_models
-        from .models import (
-            Component,
-            ComponentVersion,
-            Container,
-            ContainerVersion,
-            Section,
-            SectionVersion,
-            Subsection,
-            SubsectionVersion,
-            Unit,
-            UnitVersion,
-        )
-        register_publishable_models(Component, ComponentVersion)
-        register_publishable_models(Container, ContainerVersion)
-        register_publishable_models(Section, SectionVersion)
-        register_publishable_models(Subsection, SubsectionVersion)
-        register_publishable_models(Unit, UnitVersion)
+        from .applets.publishing.models import PublishableContentModelRegistry
+
+        for model_name in ["Component", "Container", "Section", "Subsection", "Unit"]:
+            PublishableContentModelRegistry.register_lazy(
+                f"{self.label}.{model_name}",
+                f"{self.label}.{model_name}Version",
+            )
 
     def ready(self):
         """
@@ -9,7 +9,13 @@ from datetime import datetime, timezone
 
 from django.core.management.base import BaseCommand
 
-from ...api import create_next_component_version, get_component_by_key, get_learning_package_by_key
+# The api module resolves its re-exports lazily (PEP 562), which pylint's
+# static analysis can't see.
+from ...api import (  # pylint: disable=no-name-in-module
+    create_next_component_version,
+    get_component_by_key,
+    get_learning_package_by_key,
+)
 
 
 class Command(BaseCommand):
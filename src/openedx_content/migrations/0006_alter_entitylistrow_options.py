@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_content', '0005_alter_draftchangelogrecord_dependencies_hash_digest_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='entitylistrow',
+            options={},
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:56
+
+from django.db import migrations
+
+import openedx_django_lib.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_content', '0006_alter_entitylistrow_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='draftchangelogrecord',
+            name='dependencies_hash_digest',
+            field=openedx_django_lib.fields.MultiCollationCharField(blank=True, db_collations={'mysql': 'utf8mb4_bin', 'sqlite': 'BINARY'}, db_default='', editable=False, max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='publishlogrecord',
+            name='dependencies_hash_digest',
+            field=openedx_django_lib.fields.MultiCollationCharField(blank=True, db_collations={'mysql': 'utf8mb4_bin', 'sqlite': 'BINARY'}, db_default='', editable=False, max_length=8),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:57
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_content', '0007_alter_draftchangelogrecord_dependencies_hash_digest_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='media',
+            name='size',
+            field=models.PositiveIntegerField(validators=[django.core.validators.MaxValueValidator(50000000)]),
+        ),
+    ]
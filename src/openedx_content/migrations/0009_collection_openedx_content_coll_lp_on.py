@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_content', '0008_alter_media_size'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='collection',
+            index=models.Index(fields=['learning_package', 'enabled'], name='openedx_content_coll_lp_on'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:43
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('openedx_content', '0009_collection_openedx_content_coll_lp_on'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='collectionpublishableentity',
+            name='created',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+    ]
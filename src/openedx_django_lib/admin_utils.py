@@ -1,6 +1,8 @@
 """
 Convenience utilities for the Django Admin.
 """
+from functools import cache
+
 from django.contrib import admin
 from django.db import models
 from django.db.models.fields.reverse_related import OneToOneRel
@@ -33,6 +35,22 @@ class ReadOnlyModelAdmin(admin.ModelAdmin):
         return False
 
 
+@cache
+def _admin_changelist_url(app_label: str, model_name: str) -> str | None:
+    """
+    The admin changelist URL for the given model, or None if it has no admin.
+
+    Admin detail ("change") URLs always live directly under the changelist
+    (``<changelist><pk>/change/``), so the helpers below can build a link per
+    object without paying for a ``reverse()`` call (and a possible
+    NoReverseMatch) on every row of a changelist.
+    """
+    try:
+        return reverse(f"admin:{app_label}_{model_name}_changelist")
+    except NoReverseMatch:
+        return None
+
+
 def one_to_one_related_model_html(model_obj: models.Model) -> SafeText:
     """
     HTML for clickable list of a models that are 1:1-related to ``model_obj``.
@@ -77,16 +95,13 @@ def one_to_one_related_model_html(model_obj: models.Model) -> SafeText:
 
         app_label = related_model_obj._meta.app_label
         model_name = related_model_obj._meta.model_name
-        try:
-            details_url = reverse(
-                f"admin:{app_label}_{model_name}_change",
-                args=(related_model_obj.pk,)
-            )
-        except NoReverseMatch:
+        base_url = _admin_changelist_url(app_label, model_name)
+        if base_url is None:
             # No Admin URL available, so just put the str representation of the
             # related model instance.
             text.append(f"{field_name}: {related_model_obj}")
             continue
+        details_url = f"{base_url}{related_model_obj.pk}/change/"
 
         # If we go this far, there is a related model instance and it has a
         # "change" admin page (even though it's probably read-only via
@@ -106,11 +121,15 @@ def model_detail_link(obj: models.Model, link_text: str) -> SafeText:
     """
     Render an HTML link to the admin focus page for `obj`.
     """
+    model_name = (obj._meta.model_name or obj.__class__.__name__).lower()
+    base_url = _admin_changelist_url(obj._meta.app_label, model_name)
+    if base_url is None:
+        raise NoReverseMatch(
+            f"No admin change view registered for {obj._meta.app_label}.{model_name}"
+        )
     return format_html(
-        '<a href="{}">{}</a>',
-        reverse(
-            f"admin:{obj._meta.app_label}_{(obj._meta.model_name or obj.__class__.__name__).lower()}_change",
-            args=(obj.pk,),
-        ),
+        '<a href="{}{}/change/">{}</a>',
+        base_url,
+        obj.pk,
         link_text,
     )
@@ -11,6 +11,7 @@ case-insensitive by default, SQLite and Postgres are case-sensitive.
 from __future__ import annotations
 
 import hashlib
+import sys
 import uuid
 
 from django.db import models
@@ -18,6 +19,23 @@ from django.db import models
 from .collations import MultiCollationMixin
 from .validators import validate_utc_datetime
 
+# Vendor-to-collation mappings shared by every field the helpers below create.
+# MultiCollationMixin never mutates the dict it's given, so all field instances
+# of a given case-sensitivity can point at the same one rather than each
+# allocating an identical copy at model-definition time.
+CASE_INSENSITIVE_COLLATIONS = {
+    "sqlite": "NOCASE",
+    # We're using utf8mb4_unicode_ci to keep MariaDB compatibility,
+    # since their collation support diverges after this. MySQL is now on
+    # utf8mb4_0900_ai_ci based on Unicode 9, while MariaDB has
+    # uca1400_ai_ci based on Unicode 14.
+    "mysql": "utf8mb4_unicode_ci",
+}
+CASE_SENSITIVE_COLLATIONS = {
+    "sqlite": "BINARY",
+    "mysql": "utf8mb4_bin",
+}
+
 
 def create_hash_digest(data_bytes: bytes, num_bytes=20) -> str:
     """
@@ -51,14 +69,7 @@ def case_insensitive_char_field(**kwargs) -> MultiCollationCharField:
     # Set our default arguments
     final_kwargs = {
         "null": False,
-        "db_collations": {
-            "sqlite": "NOCASE",
-            # We're using utf8mb4_unicode_ci to keep MariaDB compatibility,
-            # since their collation support diverges after this. MySQL is now on
-            # utf8mb4_0900_ai_ci based on Unicode 9, while MariaDB has
-            # uca1400_ai_ci based on Unicode 14.
-            "mysql": "utf8mb4_unicode_ci",
-        },
+        "db_collations": CASE_INSENSITIVE_COLLATIONS,
     }
     # Override our defaults with whatever is passed in.
     final_kwargs.update(kwargs)
@@ -81,10 +92,7 @@ def case_sensitive_char_field(**kwargs) -> MultiCollationCharField:
     # Set our default arguments
     final_kwargs = {
         "null": False,
-        "db_collations": {
-            "sqlite": "BINARY",
-            "mysql": "utf8mb4_bin",
-        },
+        "db_collations": CASE_SENSITIVE_COLLATIONS,
     }
     # Override our defaults with whatever is passed in.
     final_kwargs.update(kwargs)
@@ -124,7 +132,7 @@ def key_field(**kwargs) -> MultiCollationCharField:
     return case_sensitive_char_field(max_length=500, blank=False, **kwargs)
 
 
-def hash_field(**kwargs) -> models.CharField:
+def hash_field(**kwargs) -> MultiCollationCharField:
     """
     Holds a hash digest meant to identify a piece of content.
 
@@ -135,23 +143,28 @@ def hash_field(**kwargs) -> models.CharField:
     Use the create_hash_digest function to generate data suitable for this
     field.
 
+    The collation is binary: digests are canonical lowercase hex (see
+    create_hash_digest), so nothing ever needs case-insensitive matching, and
+    binary collation keeps equality lookups and the unique indexes on these
+    columns at a simple byte comparison.
+
     There are a couple of ways that we could have stored this more efficiently,
     but we don't at this time:
 
     1. A BinaryField would be the most space efficient, but Django doesn't
        support indexing a BinaryField in a MySQL database.
-    2. We could make the field case-sensitive and run it through a URL-safe
-       base64 encoding. But the amount of space this saves vs. the complexity
-       didn't seem worthwhile, particularly the possibility of case-sensitivity
-       related bugs.
+    2. We could run the digest through a URL-safe base64 encoding. But the
+       amount of space this saves vs. the complexity didn't seem worthwhile,
+       particularly the possibility of case-sensitivity related bugs.
     """
     default_kwargs = {
         "max_length": 40,
         "blank": False,
         "null": False,
         "editable": False,
+        "db_collations": CASE_SENSITIVE_COLLATIONS,
     }
-    return models.CharField(**(default_kwargs | kwargs))
+    return MultiCollationCharField(**(default_kwargs | kwargs))
 
 
 def manual_date_time_field() -> models.DateTimeField:
@@ -184,6 +197,28 @@ def manual_date_time_field() -> models.DateTimeField:
     )
 
 
+class InternedCharField(models.CharField):
+    """
+    CharField that interns values loaded from the database.
+
+    Use this for low-cardinality columns (statuses, enum-ish types) on tables
+    that get scanned in bulk. Database drivers return a fresh str object per
+    row, so reading N rows materializes N copies of the same handful of
+    values. Interning shares one object per distinct value, which saves heap
+    on large reads and lets equality checks against other interned strings
+    take the pointer-comparison fast path.
+
+    Don't use this for high-cardinality values (keys, titles, free text):
+    interned strings live for the life of the process, so interning
+    effectively-unique values just grows the intern table for no benefit.
+    """
+
+    def from_db_value(self, value, expression, connection):  # pylint: disable=unused-argument
+        if value is None:
+            return value
+        return sys.intern(value)
+
+
 class MultiCollationCharField(MultiCollationMixin, models.CharField):
     """
     CharField subclass with per-database-vendor collation settings.
@@ -7,7 +7,16 @@ from django.contrib import admin
 
 from .models import ObjectTag, Tag, Taxonomy
 
-admin.site.register(Taxonomy)
+
+@admin.register(Taxonomy)
+class TaxonomyAdmin(admin.ModelAdmin):
+    """
+    Admin definition for Taxonomy model
+    """
+    def get_queryset(self, request):
+        # The changelist only renders __str__ (class, id and name), so don't
+        # pull the potentially-large description text for every row:
+        return super().get_queryset(request).defer("description")
 
 
 @admin.register(Tag)
@@ -19,6 +28,8 @@ class TagAdmin(admin.ModelAdmin):
     search_fields = ["value", "external_id"]
     list_display = ["__str__", "taxonomy", "external_id"]
     list_filter = ["taxonomy"]
+    # The taxonomy column would otherwise query per row:
+    list_select_related = ["taxonomy"]
 
     def has_add_permission(self, request):
         """
@@ -36,6 +47,8 @@ class ObjectTagAdmin(admin.ModelAdmin):
     autocomplete_fields = ["tag"]
     list_display = ["object_id", "export_id", "value"]
     readonly_fields = ["object_id"]
+    # The export_id and value columns read self.taxonomy / self.tag:
+    list_select_related = ["taxonomy", "tag"]
 
     def has_add_permission(self, request):
         """
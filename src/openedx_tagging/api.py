@@ -14,12 +14,14 @@ from __future__ import annotations
 
 from typing import Any
 
-from django.db import models, transaction
+from django.db import connection, models, transaction
 from django.db.models import F, QuerySet, Value
-from django.db.models.functions import Coalesce, Concat, Lower
+from django.db.models.functions import Coalesce, Collate, Concat, Lower
 from django.utils.text import slugify
 from django.utils.translation import gettext as _
 
+from openedx_django_lib.fields import CASE_SENSITIVE_COLLATIONS
+
 from .data import TagDataQuerySet
 from .models import ObjectTag, Tag, Taxonomy
 from .models.utils import ConcatNull, StringAgg
@@ -159,15 +161,40 @@ def resync_object_tags(object_tags: QuerySet | None = None) -> int:
 
     By default, we iterate over all ObjectTags. Pass a filtered ObjectTags queryset to limit which tags are resynced.
     """
-    if not object_tags:
-        object_tags = ObjectTag.objects.select_related("tag", "taxonomy")
+    if object_tags is None:
+        # A blanket resync only needs to visit rows that resync() could
+        # actually change, so let the database find the candidates instead of
+        # deserializing every ObjectTag into Python: rows with a broken
+        # taxonomy link, rows missing a tag link in a closed taxonomy, and
+        # rows whose cached _export_id/_value disagree with their source of
+        # truth. resync() compares the cached values in Python, where string
+        # equality is case-sensitive, but these columns have case-insensitive
+        # collations -- so the equality checks here must force the vendor's
+        # binary collation, or a case-only rename would never make its rows
+        # candidates.
+        collation = CASE_SENSITIVE_COLLATIONS.get(connection.vendor)
+
+        def case_sensitive(field: str) -> Collate | F:
+            return Collate(F(field), collation) if collation else F(field)
+
+        object_tags = ObjectTag.objects.filter(
+            models.Q(taxonomy__isnull=True)
+            | ~models.Q(_export_id=case_sensitive("taxonomy__export_id"))
+            | models.Q(tag__isnull=True, taxonomy__allow_free_text=False)
+            | (models.Q(tag__isnull=False) & ~models.Q(_value=case_sensitive("tag__value")))
+        ).select_related("tag", "taxonomy")
 
     num_changed = 0
-    for object_tag in object_tags:
-        changed = object_tag.resync()
-        if changed:
-            object_tag.save()
-            num_changed += 1
+    # Commit all the resynced rows at once: under autocommit every save() here would
+    # be its own transaction (and its own disk flush).
+    with transaction.atomic():
+        # Stream the rows in chunks instead of materializing the full queryset;
+        # a full resync covers every ObjectTag in the database.
+        for object_tag in object_tags.iterator(chunk_size=500):
+            changed = object_tag.resync()
+            if changed:
+                object_tag.save()
+                num_changed += 1
 
     return num_changed
 
@@ -226,14 +253,16 @@ def get_object_tag_counts(object_id_pattern: str, count_implicit=False) -> dict[
     # Note: in the future we may add an option to exclude system taxonomies from the count.
     qs: Any = ObjectTag.objects
     if object_id_pattern.endswith("*"):
-        qs = qs.filter(object_id__startswith=object_id_pattern[0:len(object_id_pattern) - 1])
+        qs = qs.filter(object_id__startswith=object_id_pattern[:-1])
     elif "*" in object_id_pattern:
         raise ValueError("Wildcard matches are only supported if the * is at the end.")
     else:
         qs = qs.filter(object_id__in=object_id_pattern.split(","))
-    # Don't include deleted tags or disabled taxonomies:
-    qs = qs.exclude(taxonomy_id=None)  # The whole taxonomy was deleted
-    qs = qs.exclude(taxonomy__enabled=False)  # The whole taxonomy is disabled
+    # Don't include deleted tags or disabled taxonomies.
+    # A single positive filter covers both "the whole taxonomy was deleted" (taxonomy is
+    # NULL) and "the whole taxonomy is disabled"; it produces a plain inner-join predicate
+    # instead of the two negated clauses the planner would otherwise have to combine:
+    qs = qs.filter(taxonomy__enabled=True)
     qs = qs.exclude(tag_id=None, taxonomy__allow_free_text=False)  # The taxonomy exists but the tag is deleted
     if count_implicit:
         # Counting the implicit tags is tricky, because if two "grandchild" tags have the same implicit parent tag, we
@@ -285,6 +314,11 @@ def _check_new_tag_count(
     """
     Checks if the new count of tags for the object is equal or less than 100
     """
+    # Replacing a taxonomy's tags with an empty list can only ever shrink the
+    # total, so there's nothing to check (and no need for the COUNT query).
+    if new_tag_count == 0:
+        return
+
     # Exclude to avoid counting the tags that are going to be updated
     if taxonomy:
         current_count = ObjectTag.objects.filter(object_id=object_id).exclude(taxonomy_id=taxonomy.id).count()
@@ -321,7 +355,7 @@ def _get_current_tags(
     return current_tags
 
 
-def tag_object(  # pylint: disable=too-many-positional-arguments
+def tag_object(  # pylint: disable=too-many-positional-arguments,too-many-statements
     object_id: str,
     taxonomy: Taxonomy | None,
     tags: list[str],
@@ -369,33 +403,56 @@ def tag_object(  # pylint: disable=too-many-positional-arguments
 
     updated_tags = []
     if taxonomy and taxonomy.allow_free_text:
+        # Values are unique per taxonomy + object, so index the current tags by value
+        # to avoid a linear scan for each applied tag:
+        current_tags_by_value = {t.value: t for t in current_tags}
         for tag_value in tags:
-            object_tag_index = next((i for (i, t) in enumerate(current_tags) if t.value == tag_value), -1)
-            if object_tag_index >= 0:
-                # This tag is already applied.
-                object_tag = current_tags.pop(object_tag_index)
-            else:
+            object_tag = current_tags_by_value.pop(tag_value, None)
+            if object_tag is None:
+                # We are newly applying this tag:
                 object_tag = ObjectTagClass(taxonomy=taxonomy, object_id=object_id, _value=tag_value)
                 updated_tags.append(object_tag)
+        # Whatever wasn't applied above gets deleted below:
+        current_tags = list(current_tags_by_value.values())
     else:
         # Handle closed taxonomies:
+        # Tag IDs are unique per taxonomy + object, so index the current tags by tag ID
+        # to avoid a linear scan for each applied tag. Tags whose Tag row was deleted
+        # (tag_id=None) can never match an applied tag, so they go straight to the
+        # "delete any omitted existing tags" step below:
+        remaining_tags = [t for t in current_tags if t.tag_id is None]
+        current_tags_by_tag_id = {t.tag_id: t for t in current_tags if t.tag_id is not None}
+        # For plain taxonomies, fetch all the applied values in one query,
+        # rather than one tag_for_value() query per tag. Values that miss
+        # this dict (case-variant matches, since values compare
+        # case-insensitively in the database) still fall back to
+        # tag_for_value() below. Taxonomy subclasses are excluded because
+        # their tag_for_value() can do more than a lookup, e.g. re-validating
+        # or creating Tags against a backing model just in time.
+        prefetched_tags_by_value: dict[str, Tag] = {}
+        if taxonomy and type(taxonomy) is Taxonomy:  # pylint: disable=unidiomatic-typecheck
+            prefetched_tags_by_value = {
+                t.value: t
+                for t in taxonomy.tag_set.filter(value__in=[v.strip() for v in tags])
+            }
         for tag_value in tags:
             tag = None
             # When export, sometimes, the value has a space at the beginning and end.
             tag_value = tag_value.strip()
             if taxonomy:
-                try:
-                    tag = taxonomy.tag_for_value(tag_value)  # Will raise Tag.DoesNotExist if the value is invalid.
-                except Tag.DoesNotExist as e:
-                    if not create_invalid:
-                        raise e
+                tag = prefetched_tags_by_value.get(tag_value)
+                if tag is None:
+                    try:
+                        tag = taxonomy.tag_for_value(tag_value)  # Will raise Tag.DoesNotExist if the value is invalid.
+                    except Tag.DoesNotExist as e:
+                        if not create_invalid:
+                            raise e
 
             if tag:
                 # Tag exists in the taxonomy
-                object_tag_index = next((i for (i, t) in enumerate(current_tags) if t.tag_id == tag.id), -1)
-                if object_tag_index >= 0:
+                object_tag = current_tags_by_tag_id.pop(tag.id, None)
+                if object_tag is not None:
                     # This tag is already applied.
-                    object_tag = current_tags.pop(object_tag_index)
                     if object_tag._value != tag.value:  # pylint: disable=protected-access
                         # The ObjectTag's cached '_value' is out of sync with the Tag, so update it:
                         object_tag._value = tag.value  # pylint: disable=protected-access
@@ -420,6 +477,8 @@ def tag_object(  # pylint: disable=too-many-positional-arguments
                         _export_id=taxonomy_export_id
                     )
                     updated_tags.append(object_tag)
+        # Whatever wasn't applied above gets deleted below:
+        current_tags = remaining_tags + list(current_tags_by_tag_id.values())
 
     # Save all updated tags at once to avoid partial updates
     with transaction.atomic():
@@ -427,9 +486,20 @@ def tag_object(  # pylint: disable=too-many-positional-arguments
         for old_tag in current_tags:
             old_tag.delete()
         # add the new tags:
+        new_object_tags = []
         for object_tag in updated_tags:
-            object_tag.full_clean()  # Run validation
-            object_tag.save()
+            # Run validation, but skip the per-row uniqueness SELECTs; the
+            # unique_together constraints on ObjectTag enforce this at the DB
+            # layer anyway, and we're inside a transaction.
+            object_tag.full_clean(validate_unique=False)
+            if object_tag.pk:
+                object_tag.save()
+            else:
+                new_object_tags.append(object_tag)
+        # Insert all the newly applied tags in one statement instead of one
+        # INSERT per tag:
+        if new_object_tags:
+            ObjectTagClass.objects.bulk_create(new_object_tags)
 
 
 def add_tag_to_taxonomy(
@@ -449,7 +519,7 @@ def add_tag_to_taxonomy(
     # Resync all related ObjectTags after creating new Tag to
     # to ensure any existing ObjectTags with the same value will
     # be linked to the new Tag
-    object_tags = taxonomy.objecttag_set.all()
+    object_tags = taxonomy.objecttag_set.select_related("tag", "taxonomy")
     resync_object_tags(object_tags)
 
     return new_tag
@@ -463,10 +533,23 @@ def update_tag_in_taxonomy(taxonomy: Taxonomy, tag: str, new_value: str):
     Currently only supports updating the Tag value.
     """
     taxonomy = taxonomy.cast()
+    # Look the stored value up the same (case-insensitive) way update_tag
+    # will, so the no-op check below compares against what's actually in the
+    # database rather than the caller's casing of `tag`. A change of case only
+    # is *not* a no-op, since Tag values compare case-insensitively in the
+    # database but not in the search index.
+    old_value = taxonomy.tag_set.filter(value=tag).values_list("value", flat=True).first()
     updated_tag = taxonomy.update_tag(tag, new_value)
-
-    # Resync all related ObjectTags to update to the new Tag value
-    object_tags = taxonomy.objecttag_set.all()
+    if old_value == new_value:
+        # Nothing changed in the database, so skip the resync below entirely.
+        return updated_tag
+
+    # Resync the related ObjectTags to update to the new Tag value. Only the
+    # ObjectTags linked to this Tag (or to no Tag at all, in case the new value
+    # now matches one of them) can be affected, so don't re-check the rest.
+    object_tags = taxonomy.objecttag_set.filter(
+        models.Q(tag=updated_tag) | models.Q(tag__isnull=True)
+    ).select_related("tag", "taxonomy")
     resync_object_tags(object_tags)
 
     return updated_tag
@@ -507,15 +590,37 @@ def copy_tags(source_object_id: str, dest_object_id: str):
         # Delete all copied tags of destination
         copied_tags.delete()
 
-        # Copy an create object_tags in destination
+        # Copy and create object_tags in destination. Instead of one
+        # SELECT + UPDATE/INSERT per source tag, fetch the surviving
+        # destination tags once and split the work into a single bulk
+        # UPDATE plus a single bulk INSERT.
+        existing_tags = {
+            (tag.taxonomy_id, tag.tag_id): tag
+            # Only the keys and the copied flag are needed here, so skip
+            # fetching the (potentially long) _value/_export_id columns:
+            for tag in ObjectTag.objects.filter(object_id=dest_object_id).only("id", "taxonomy", "tag", "is_copied")
+        }
+        tags_to_mark_copied = []
+        tags_to_create = []
         for object_tag in source_object_tags:
-            ObjectTag.objects.update_or_create(
-                object_id=dest_object_id,
-                taxonomy_id=object_tag.taxonomy_id,
-                tag_id=object_tag.tag_id,
-                defaults={"is_copied": True},
-                # Note: _value and _export_id are set automatically
-            )
+            existing_tag = existing_tags.get((object_tag.taxonomy_id, object_tag.tag_id))
+            if existing_tag:
+                if not existing_tag.is_copied:
+                    tags_to_mark_copied.append(existing_tag.pk)
+            else:
+                tags_to_create.append(ObjectTag(
+                    object_id=dest_object_id,
+                    taxonomy=object_tag.taxonomy,
+                    tag=object_tag.tag,
+                    # Copy _value explicitly so free-text tags (tag=None) keep their value:
+                    _value=object_tag._value,  # pylint: disable=protected-access
+                    is_copied=True,
+                    # Note: _export_id is set automatically
+                ))
+        if tags_to_mark_copied:
+            ObjectTag.objects.filter(pk__in=tags_to_mark_copied).update(is_copied=True)
+        if tags_to_create:
+            ObjectTag.objects.bulk_create(tags_to_create)
 
 
 def unmark_copied_tags(object_id: str) -> None:
@@ -9,6 +9,36 @@ from ..models import Tag, Taxonomy
 from .exceptions import ImportActionConflict, ImportActionError
 
 
+def get_existing_tag(taxonomy: Taxonomy, external_id: str | None) -> Tag | None:
+    """
+    Memoized version of ``taxonomy.tag_set.get(external_id=...)`` for planning.
+
+    While an import plan is generated, several action classes probe the
+    database for the same imported tag (and the validators probe again for
+    its parent), fetching each external_id up to four times. Cache the result
+    on the taxonomy instance instead. The cache only covers the planning
+    phase: ``TagImportPlan.generate_actions`` resets it before planning, and
+    execution-phase lookups keep hitting the database so they can see tags
+    created earlier in the same run.
+    """
+    cache = taxonomy.__dict__.setdefault("_import_plan_tag_cache", {})
+    if external_id not in cache:
+        try:
+            cache[external_id] = taxonomy.tag_set.select_related("parent").get(
+                external_id=external_id
+            )
+        except Tag.DoesNotExist:
+            cache[external_id] = None
+    return cache[external_id]
+
+
+def reset_existing_tag_cache(taxonomy: Taxonomy) -> None:
+    """
+    Clear the planning-phase tag cache (see ``get_existing_tag``).
+    """
+    taxonomy.__dict__.pop("_import_plan_tag_cache", None)
+
+
 class ImportAction:
     """
     Base class to create actions
@@ -99,10 +129,8 @@ class ImportAction:
         """
         Helper method to validate that the parent tag has already been defined.
         """
-        try:
-            # Validates that the parent exists on the taxonomy
-            self.taxonomy.tag_set.get(external_id=self.tag.parent_id)
-        except Tag.DoesNotExist:
+        # Validates that the parent exists on the taxonomy
+        if get_existing_tag(self.taxonomy, self.tag.parent_id) is None:
             # Or if the parent is created on previous actions
             if not self._search_action(
                 indexed_actions, CreateTag.name, "id", self.tag.parent_id
@@ -197,11 +225,7 @@ class CreateTag(ImportAction):
         """
         This action applies whenever the tag does not exist
         """
-        try:
-            taxonomy.tag_set.get(external_id=tag.id)
-            return False
-        except Tag.DoesNotExist:
-            return True
+        return get_existing_tag(taxonomy, tag.id) is None
 
     def _validate_id(self, indexed_actions) -> ImportActionError | None:
         """
@@ -282,14 +306,13 @@ class UpdateParentTag(ImportAction):
         """
         This action applies whenever there is a change on the parent
         """
-        try:
-            taxonomy_tag = taxonomy.tag_set.get(external_id=tag.id)
-            return (
-                taxonomy_tag.parent is not None
-                and taxonomy_tag.parent.external_id != tag.parent_id
-            ) or (taxonomy_tag.parent is None and tag.parent_id is not None)
-        except Tag.DoesNotExist:
+        taxonomy_tag = get_existing_tag(taxonomy, tag.id)
+        if taxonomy_tag is None:
             return False
+        return (
+            taxonomy_tag.parent is not None
+            and taxonomy_tag.parent.external_id != tag.parent_id
+        ) or (taxonomy_tag.parent is None and tag.parent_id is not None)
 
     def validate(self, indexed_actions) -> list[ImportActionError]:
         """
@@ -344,11 +367,10 @@ class RenameTag(ImportAction):
         """
         This action applies whenever there is a change on the tag value
         """
-        try:
-            taxonomy_tag = taxonomy.tag_set.get(external_id=tag.id)
-            return taxonomy_tag.value != tag.value
-        except Tag.DoesNotExist:
+        taxonomy_tag = get_existing_tag(taxonomy, tag.id)
+        if taxonomy_tag is None:
             return False
+        return taxonomy_tag.value != tag.value
 
     def validate(self, indexed_actions) -> list[ImportActionError]:
         """
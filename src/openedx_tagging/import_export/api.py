@@ -53,6 +53,13 @@ from ..models import TagImportTask, TagImportTaskState, Taxonomy
 from .import_plan import TagImportPlan, TagImportTask
 from .parsers import ParserFormat, get_parser
 
+# Terminal task states, bound to their raw DB values once at import time;
+# a new import may only start when the previous task reached one of these.
+_FINISHED_TASK_STATES = frozenset({
+    TagImportTaskState.SUCCESS.value,
+    TagImportTaskState.ERROR.value,
+})
+
 
 def import_tags(
     taxonomy: Taxonomy,
@@ -161,20 +168,20 @@ def get_last_import_status(taxonomy: Taxonomy) -> TagImportTaskState:
     """
     Get status of the last import task of the given taxonomy
     """
-    task = _get_last_import_task(taxonomy)
-    if task is None:
+    status = _get_last_import_task_value(taxonomy, "status")
+    if status is None:
         raise ValueError("No import task was created yet.")
-    return TagImportTaskState(task.status)
+    return TagImportTaskState(status)
 
 
 def get_last_import_log(taxonomy: Taxonomy) -> str:
     """
     Get logs of the last import task of the given taxonomy
     """
-    task = _get_last_import_task(taxonomy)
-    if task is None:
+    log = _get_last_import_task_value(taxonomy, "log")
+    if log is None:
         raise ValueError("No import task was created yet.")
-    return task.log
+    return log
 
 
 def export_tags(taxonomy: Taxonomy, output_format: ParserFormat) -> str:
@@ -190,24 +197,23 @@ def _check_unique_import_task(taxonomy: Taxonomy) -> bool:
     Verifies if there is another in progress import task for the
     given taxonomy
     """
-    last_task = _get_last_import_task(taxonomy)
-    if not last_task:
+    last_status = _get_last_import_task_value(taxonomy, "status")
+    if last_status is None:
         return True
-    return (
-        last_task.status in {
-            TagImportTaskState.SUCCESS.value,
-            TagImportTaskState.ERROR.value
-        }
-    )
+    return last_status in _FINISHED_TASK_STATES
 
 
-def _get_last_import_task(taxonomy: Taxonomy) -> TagImportTask | None:
+def _get_last_import_task_value(taxonomy: Taxonomy, field: str):
     """
-    Get the last import task for the given taxonomy
+    Get a single field of the last import task for the given taxonomy.
+
+    Fetching just the requested column avoids loading the full task row,
+    whose `log` field can grow very large.
     """
     return (
         TagImportTask.objects.filter(taxonomy=taxonomy)
         .order_by("-creation_date")
+        .values_list(field, flat=True)
         .first()
     )
 
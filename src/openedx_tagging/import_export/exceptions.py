@@ -24,7 +24,7 @@ class TagImportError(Exception):
         return str(self.message)
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({str(self)})"
+        return f"{self.__class__.__name__}({self})"
 
 
 class TagParserError(TagImportError):
@@ -7,7 +7,14 @@ from attrs import define
 from django.db import transaction
 
 from ..models import Tag, TagImportTask, Taxonomy
-from .actions import DeleteTag, ImportAction, UpdateParentTag, WithoutChanges, available_actions
+from .actions import (
+    DeleteTag,
+    ImportAction,
+    UpdateParentTag,
+    WithoutChanges,
+    available_actions,
+    reset_existing_tag_cache,
+)
 from .exceptions import ImportActionError
 
 
@@ -108,8 +115,15 @@ class TagImportPlan:
         """
         Adds delete actions for `tags`
         """
+        # Fetch the children of all the tags being deleted in one query,
+        # instead of one `tag.children.all()` query per deleted tag:
+        children_by_parent_id: dict[int, list[Tag]] = {}
+        for child in Tag.objects.filter(parent__in=tags.values()).only("id", "parent_id", "external_id", "value"):
+            assert child.parent_id is not None  # guaranteed by the parent__in filter
+            children_by_parent_id.setdefault(child.parent_id, []).append(child)
+
         for tag in tags.values():
-            for child in tag.children.all():
+            for child in children_by_parent_id.get(tag.id, []):
                 # Verify if there is not a parent update before
                 if not self._search_parent_update(self._get_tag_id(child), self._get_tag_id(tag)):
                     # Change parent to avoid delete childs
@@ -152,11 +166,17 @@ class TagImportPlan:
         self.actions.clear()
         self.errors.clear()
         self._init_indexed_actions()
+        # Drop any tags memoized by a previous plan for this taxonomy
+        # instance; executed actions may have changed them since:
+        reset_existing_tag_cache(self.taxonomy)
         tags_for_delete = {}
 
         if replace:
+            # Only the id fields and value are read below, so don't pull whole
+            # rows for what can be the entire taxonomy:
             tags_for_delete = {
-                self._get_tag_id(tag): tag for tag in self.taxonomy.tag_set.all()
+                self._get_tag_id(tag): tag
+                for tag in self.taxonomy.tag_set.only("id", "external_id", "value")
             }
 
             for tag in tags:
@@ -193,7 +213,7 @@ class TagImportPlan:
         if self.errors:
             result += "\nOutput errors\n" "--------------------------------\n"
             for error in self.errors:
-                result += f"{str(error)}\n"
+                result += f"{error}\n"
 
         return result
 
@@ -215,4 +235,4 @@ class TagImportPlan:
             if task:
                 task.add_log("Success", save=False)
         if task:
-            task.save()
+            task.save(update_fields=["log"])
@@ -170,6 +170,9 @@ class Parser:
         way.
         """
         tags = taxonomy.get_filtered_tags().all()
+        # Index the tags by value once, rather than scanning the whole list
+        # for the parent of every child tag:
+        tags_by_value = {tag["value"]: tag for tag in tags}
         result = []
         for tag in tags:
             result_tag = {
@@ -177,7 +180,7 @@ class Parser:
                 "value": tag["value"],
             }
             if tag["parent_value"]:
-                parent_tag = next(t for t in tags if t["value"] == tag["parent_value"])
+                parent_tag = tags_by_value[tag["parent_value"]]
                 result_tag["parent_id"] = parent_tag["external_id"] or parent_tag["_id"]
             result.append(result_tag)
         return result
@@ -310,7 +313,8 @@ class CSVParser(Parser):
 
 
 # Add parsers here
-_parsers = [JSONParser, CSVParser]
+# Built once at module scope; get_parser is a plain dict lookup.
+_parsers = {parser.format: parser for parser in (JSONParser, CSVParser)}
 
 
 def get_parser(parser_format: ParserFormat) -> type[Parser]:
@@ -319,8 +323,9 @@ def get_parser(parser_format: ParserFormat) -> type[Parser]:
 
     Raise `ValueError` if no parser found
     """
-    for parser in _parsers:
-        if parser_format == parser.format:
-            return parser
-
-    raise ValueError(_("Parser not found for format {parser_format}").format(parser_format=parser_format))
+    try:
+        return _parsers[parser_format]
+    except KeyError:
+        raise ValueError(
+            _("Parser not found for format {parser_format}").format(parser_format=parser_format)
+        ) from None
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0019_language_taxonomy_class'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='objecttag',
+            index=models.Index(fields=['_export_id', 'object_id'], name='oel_tagging__export_1bca00_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0020_objecttag_oel_tagging__export_1bca00_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='objecttag',
+            index=models.Index(fields=['object_id', 'taxonomy'], name='oel_tagging_object__f9e1a2_idx'),
+        ),
+    ]
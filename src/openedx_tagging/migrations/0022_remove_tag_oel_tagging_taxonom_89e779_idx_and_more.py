@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0021_objecttag_oel_tagging_object__f9e1a2_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tag',
+            name='oel_tagging_taxonom_89e779_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='tag',
+            name='oel_tagging_taxonom_44e355_idx',
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:53
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0022_remove_tag_oel_tagging_taxonom_89e779_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tagimporttask',
+            name='creation_date',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
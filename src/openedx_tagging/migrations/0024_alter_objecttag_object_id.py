@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:20
+
+from django.db import migrations
+
+import openedx_django_lib.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0023_alter_tagimporttask_creation_date'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='objecttag',
+            name='object_id',
+            field=openedx_django_lib.fields.MultiCollationCharField(db_collations={'mysql': 'utf8mb4_bin', 'sqlite': 'BINARY'}, editable=False, help_text='Identifier for the object being tagged', max_length=255),
+        ),
+    ]
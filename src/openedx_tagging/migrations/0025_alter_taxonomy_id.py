@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0024_alter_objecttag_object_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taxonomy',
+            name='id',
+            field=models.AutoField(primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:35
+
+from django.db import migrations
+
+import openedx_django_lib.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0025_alter_taxonomy_id'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='taxonomy',
+            name='name',
+            field=openedx_django_lib.fields.MultiCollationCharField(db_collations={'mysql': 'utf8mb4_unicode_ci', 'sqlite': 'NOCASE'}, help_text='User-facing label used when applying tags from this taxonomy to Open edX objects.', max_length=255),
+        ),
+    ]
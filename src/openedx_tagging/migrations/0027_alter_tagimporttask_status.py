@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:40
+
+from django.db import migrations
+
+import openedx_django_lib.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('oel_tagging', '0026_alter_taxonomy_name'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tagimporttask',
+            name='status',
+            field=openedx_django_lib.fields.InternedCharField(choices=[('loading_data', 'Loading Data'), ('planning', 'Planning'), ('executing', 'Executing'), ('success', 'Success'), ('error', 'Error')], help_text='Task status', max_length=20),
+        ),
+    ]
@@ -3,6 +3,7 @@ Tagging app base data models
 """
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from typing import List
@@ -19,7 +20,7 @@ from typing_extensions import Self  # Until we upgrade to python 3.11
 from openedx_django_lib.fields import MultiCollationTextField, case_insensitive_char_field, case_sensitive_char_field
 
 from ..data import TagDataQuerySet
-from .utils import RESERVED_TAG_CHARS, ConcatNull
+from .utils import RESERVED_TAG_CHARS_RE, ConcatNull
 
 log = logging.getLogger(__name__)
 
@@ -27,6 +28,26 @@ log = logging.getLogger(__name__)
 # Maximum depth allowed for a hierarchical taxonomy's tree of tags.
 TAXONOMY_MAX_DEPTH = 3
 
+# Characters allowed in a Taxonomy.export_id, compiled once rather than on
+# every clean()/full_clean() call. Anchored with \Z rather than $, since $
+# would also accept a trailing newline. Note that \w must stay Unicode-aware:
+# default export_ids are built with slugify(..., allow_unicode=True).
+EXPORT_ID_REGEX = re.compile(r'^[\w\-.]+\Z')
+
+
+@functools.lru_cache(maxsize=None)
+def _import_taxonomy_class(taxonomy_class_path: str) -> type:
+    """
+    Import and cache a Taxonomy subclass by its dotted path.
+
+    Taxonomy.cast() resolves the subclass on every API call, so avoid paying
+    the module/attribute resolution cost of import_string() more than once per
+    distinct path. There are only a handful of Taxonomy subclasses per
+    process, so an unbounded cache is fine.
+    """
+    return import_string(taxonomy_class_path)
+
+
 # Ancestry of a given tag; the Tag.value fields of a given tag and its parents, starting from the root.
 # Will contain 0...TAXONOMY_MAX_DEPTH elements.
 Lineage = List[str]
@@ -76,10 +97,9 @@ class Tag(models.Model):
     )
 
     class Meta:
-        indexes = [
-            models.Index(fields=["taxonomy", "value"]),
-            models.Index(fields=["taxonomy", "external_id"]),
-        ]
+        # Note: no extra indexes needed; the unique_together constraints below
+        # each create a unique index on the same column pairs, which serves
+        # the (taxonomy, value) and (taxonomy, external_id) lookups too.
         unique_together = [
             ["taxonomy", "external_id"],
             ["taxonomy", "value"],
@@ -177,10 +197,13 @@ class Tag(models.Model):
         How many descendant tags this tag has in the taxonomy.
         """
         if self.taxonomy and not self.taxonomy.allow_free_text:
+            # One COUNT covering all three levels, rather than a COUNT of the
+            # deeper levels plus child_count's separate query:
             return self.taxonomy.tag_set.filter(
+                Q(parent=self) |
                 Q(parent__parent=self) |
                 Q(parent__parent__parent=self)
-            ).count() + self.child_count
+            ).count()
         return 0
 
     def clean(self):
@@ -192,9 +215,9 @@ class Tag(models.Model):
         if self.external_id:
             self.external_id = self.external_id.strip()
 
-        for reserved_char in RESERVED_TAG_CHARS:
-            if reserved_char in self.value:
-                raise ValidationError(f"Tags cannot contain a '{reserved_char}' character.")
+        reserved_match = RESERVED_TAG_CHARS_RE.search(self.value)
+        if reserved_match:
+            raise ValidationError(f"Tags cannot contain a '{reserved_match.group()}' character.")
 
         if self.external_id and "\t" in self.external_id:
             raise ValidationError("Tag external ID cannot contain a TAB character.")
@@ -205,11 +228,17 @@ class Taxonomy(models.Model):
     Represents a namespace and rules for a group of tags.
     """
 
-    id = models.BigAutoField(primary_key=True)
+    # A server will only ever have a modest number of taxonomies, but the
+    # unbounded Tag and ObjectTag tables both carry a foreign key to this
+    # model, so a 4-byte AutoField keeps those columns (and every index that
+    # includes taxonomy_id) half the width of the app's BigAutoField default.
+    id = models.AutoField(primary_key=True)
+    # No index on name: a server only has a handful of taxonomies, so sorting
+    # or filtering by name never benefits from one, and it would be maintained
+    # on every write.
     name = case_insensitive_char_field(
         null=False,
         max_length=255,
-        db_index=True,
         help_text=_(
             "User-facing label used when applying tags from this taxonomy to Open edX objects."
         ),
@@ -297,7 +326,7 @@ class Taxonomy(models.Model):
         May raise ImportError if a custom taxonomy_class cannot be imported.
         """
         if self._taxonomy_class:
-            return import_string(self._taxonomy_class)
+            return _import_taxonomy_class(self._taxonomy_class)
         return None
 
     @taxonomy_class.setter
@@ -319,6 +348,8 @@ class Taxonomy(models.Model):
             )
         else:
             self._taxonomy_class = None
+        # Any copy cast() has memoized is for the old class:
+        self.__dict__.pop("_cached_cast", None)
 
     @property
     def system_defined(self) -> bool:
@@ -331,7 +362,7 @@ class Taxonomy(models.Model):
     def clean(self):
         super().clean()
 
-        if not re.match(r'^[\w\-.]+$', self.export_id):
+        if not EXPORT_ID_REGEX.match(self.export_id):
             raise ValidationError(
                 "The export_id should only contain alphanumeric characters or '_' '-' '.'"
             )
@@ -341,11 +372,22 @@ class Taxonomy(models.Model):
         Returns the current Taxonomy instance cast into its taxonomy_class.
 
         If no taxonomy_class is set, or if we're unable to import it, then just returns self.
+
+        The cast copy is memoized on this instance: API entry points all call
+        cast() defensively, so one request can cast the same row several
+        times, and each cast was allocating a fresh subclass instance.
+        Mutating ``self`` after a cast was never reflected in previously-cast
+        copies anyway, so reusing the copy doesn't change semantics.
         """
+        cached = self.__dict__.get("_cached_cast")
+        if cached is not None:
+            return cached
         try:
             TaxonomyClass = self.taxonomy_class
             if TaxonomyClass and not isinstance(self, TaxonomyClass):
-                return TaxonomyClass().copy(self)
+                cast_copy = TaxonomyClass().copy(self)
+                self.__dict__["_cached_cast"] = cast_copy
+                return cast_copy
         except ImportError:
             # Log error and continue
             log.exception(
@@ -380,6 +422,13 @@ class Taxonomy(models.Model):
             # pylint: disable=protected-access,attribute-defined-outside-init
             self._prefetched_objects_cache: dict = taxonomy._prefetched_objects_cache
 
+        # Keep the "tags_count" annotation (if any) so the casted taxonomy doesn't have to re-count its tags.
+        # Copied via setattr so mypy doesn't mistake this query-time annotation for a declared model
+        # field, which would conflict with the QuerySet.annotate() calls in the REST views.
+        if hasattr(taxonomy, 'tags_count'):
+            # pylint: disable-next=literal-used-as-attribute
+            setattr(self, 'tags_count', getattr(taxonomy, 'tags_count'))
+
         return self
 
     def get_filtered_tags(  # pylint: disable=too-many-positional-arguments
@@ -545,11 +594,14 @@ class Taxonomy(models.Model):
             )
             if excluded_values:
                 matching_tags = matching_tags.exclude(value__in=excluded_values)
-            matching_ids = []
+            # Use a set because the same ancestor appears once per matching
+            # descendant; deduplicating here keeps the pk__in list (and the
+            # SQL statement we send) as small as possible.
+            matching_ids = set()
             for row in matching_tags:
                 for pk in row.values():
                     if pk is not None:
-                        matching_ids.append(pk)
+                        matching_ids.add(pk)
             qs = qs.filter(pk__in=matching_ids)
             qs = qs.annotate(
                 child_count=models.Count("children", filter=Q(children__pk__in=matching_ids), distinct=True),
@@ -624,19 +676,29 @@ class Taxonomy(models.Model):
                 "add_tag() doesn't work for system defined taxonomies. They cannot be modified."
             )
 
-        if self.tag_set.filter(value__iexact=tag_value).exists():
+        # Note: Tag.value and Tag.external_id use case-insensitive collations,
+        # so the plain equality lookups in these methods match insensitively
+        # while still being served by the (taxonomy, value/external_id)
+        # indexes. An `iexact` lookup here would compile to a LIKE that can't
+        # use the index.
+        if self.tag_set.filter(value=tag_value).exists():
             raise ValueError(f"Tag with value '{tag_value}' already exists for taxonomy.")
 
         parent = None
         if parent_tag_value:
             # Get parent tag from taxonomy, raises Tag.DoesNotExist if doesn't
             # belong to taxonomy
-            parent = self.tag_set.get(value__iexact=parent_tag_value)
+            parent = self.tag_set.get(value=parent_tag_value)
 
-        tag = Tag.objects.create(
+        tag = Tag(
             taxonomy=self, value=tag_value, parent=parent, external_id=external_id
         )
-        tag.full_clean()
+        # Validate (and normalize, e.g. strip whitespace) *before* the INSERT,
+        # and skip the uniqueness SELECTs: we just checked for an existing
+        # value above, and the unique_together constraints enforce it at the
+        # DB layer regardless.
+        tag.full_clean(validate_unique=False)
+        tag.save()
 
         return tag
 
@@ -659,9 +721,12 @@ class Taxonomy(models.Model):
 
         # Update Tag instance with new value, raises Tag.DoesNotExist if
         # tag doesn't belong to taxonomy
-        tag_to_update = self.tag_set.get(value__iexact=tag)
+        tag_to_update = self.tag_set.get(value=tag)
+        if tag_to_update.value == new_value:
+            # No-op update; skip the UPDATE query.
+            return tag_to_update
         tag_to_update.value = new_value
-        tag_to_update.save()
+        tag_to_update.save(update_fields=["value"])
         return tag_to_update
 
     def delete_tags(self, tags: List[str], with_subtags: bool = False):
@@ -684,13 +749,20 @@ class Taxonomy(models.Model):
 
         tags_to_delete = self.tag_set.filter(value__in=tags)
 
-        if tags_to_delete.count() != len(tags):
+        # Count the matching tags and their children in one aggregate query,
+        # instead of a COUNT followed by a separate EXISTS probe:
+        stats = tags_to_delete.aggregate(
+            num_tags=models.Count("id", distinct=True),
+            num_children=models.Count("children"),
+        )
+
+        if stats["num_tags"] != len(tags):
             # If they do not match that means there is one or more Tag ID(s)
             # provided that do not belong to this Taxonomy
             raise ValueError("Invalid tag id provided or tag id does not belong to taxonomy")
 
         # Check if any Tag contains subtags (children)
-        contains_children = tags_to_delete.filter(children__isnull=False).distinct().exists()
+        contains_children = stats["num_children"] > 0
 
         if contains_children and not with_subtags:
             raise ValueError(
@@ -713,7 +785,7 @@ class Taxonomy(models.Model):
         self.check_casted()
         if self.allow_free_text:
             return value != "" and isinstance(value, str)
-        return self.tag_set.filter(value__iexact=value).exists()
+        return self.tag_set.filter(value=value).exists()
 
     def tag_for_value(self, value: str) -> Tag:
         """
@@ -726,7 +798,7 @@ class Taxonomy(models.Model):
         self.check_casted()
         if self.allow_free_text:
             raise ValueError("tag_for_value() doesn't work for free text taxonomies. They don't use Tag instances.")
-        return self.tag_set.get(value__iexact=value)
+        return self.tag_set.get(value=value)
 
     def validate_external_id(self, external_id: str) -> bool:
         """
@@ -735,7 +807,7 @@ class Taxonomy(models.Model):
         self.check_casted()
         if self.allow_free_text:
             return False  # Free text taxonomies don't use 'external_id' on their tags
-        return self.tag_set.filter(external_id__iexact=external_id).exists()
+        return self.tag_set.filter(external_id=external_id).exists()
 
     def tag_for_external_id(self, external_id: str) -> Tag:
         """
@@ -748,7 +820,7 @@ class Taxonomy(models.Model):
         self.check_casted()
         if self.allow_free_text:
             raise ValueError("tag_for_external_id() doesn't work for free text taxonomies.")
-        return self.tag_set.get(external_id__iexact=external_id)
+        return self.tag_set.get(external_id=external_id)
 
 
 class ObjectTag(models.Model):
@@ -770,9 +842,11 @@ class ObjectTag(models.Model):
     """
 
     id = models.BigAutoField(primary_key=True)
+    # No standalone db_index here: the ("object_id", "taxonomy") index below
+    # serves object_id-only lookups via its leading column, so a second B-tree
+    # would just be extra maintenance on every write.
     object_id = case_sensitive_char_field(
         max_length=255,
-        db_index=True,
         editable=False,
         help_text=_("Identifier for the object being tagged"),
     )
@@ -824,6 +898,12 @@ class ObjectTag(models.Model):
         indexes = [
             models.Index(fields=["taxonomy", "object_id"]),
             models.Index(fields=["taxonomy", "_value"]),
+            # Serves tagging by export_id when the taxonomy doesn't exist (yet),
+            # e.g. tag_object(taxonomy=None, taxonomy_export_id=...) and resync:
+            models.Index(fields=["_export_id", "object_id"]),
+            # Covers the per-object tag counts and the "100 tags per object" check,
+            # which filter by object_id and taxonomy without touching other columns:
+            models.Index(fields=["object_id", "taxonomy"]),
         ]
         unique_together = [
             ("object_id", "taxonomy", "tag_id"),
@@ -849,11 +929,14 @@ class ObjectTag(models.Model):
         """
         User-facing string representation of an ObjectTag.
         """
-        if self.taxonomy:
-            name = self.taxonomy.name
-        else:
-            name = self.export_id
-        return f"<{self.__class__.__name__}> {self.object_id}: {name}={self.value}"
+        # Resolve the related objects once; repr-ing a list of ObjectTags
+        # would otherwise dispatch through the FK descriptors and the
+        # export_id/value properties several times per tag.
+        taxonomy = self.taxonomy
+        tag = self.tag
+        name = taxonomy.name if taxonomy else self._export_id
+        value = tag.value if tag else self._value
+        return f"<{self.__class__.__name__}> {self.object_id}: {name}={value}"
 
     @property
     def export_id(self) -> str:
@@ -905,20 +988,25 @@ class ObjectTag(models.Model):
         the django admin. So it's best practice to call obj_tag.full_clean()
         before saving.
         """
-        if self.tag:
-            if self.tag.taxonomy_id != self.taxonomy_id:
+        # clean() runs once per ObjectTag when tagging an object, so load the
+        # related tag/taxonomy once instead of going through the FK descriptor
+        # for every check below:
+        tag = self.tag
+        taxonomy = self.taxonomy
+        if tag:
+            if tag.taxonomy_id != self.taxonomy_id:
                 raise ValidationError("ObjectTag's Taxonomy does not match Tag taxonomy")
-            if self.tag.value != self._value:
+            if tag.value != self._value:
                 raise ValidationError("ObjectTag's _value is out of sync with Tag.value")
         else:
             # Note: self.taxonomy and/or self.tag may be NULL which is OK, because it means the Tag/Taxonomy
             # was deleted, but we still preserve this _value here in case the Taxonomy or Tag get re-created in future.
             if self._value == "":
                 raise ValidationError("Invalid _value - empty string")
-            for reserved_char in RESERVED_TAG_CHARS:
-                if reserved_char in self.value:
-                    raise ValidationError(f"Invalid _value - '{reserved_char}' is not allowed")
-        if self.taxonomy and self.taxonomy.export_id != self._export_id:
+            reserved_match = RESERVED_TAG_CHARS_RE.search(self._value)
+            if reserved_match:
+                raise ValidationError(f"Invalid _value - '{reserved_match.group()}' is not allowed")
+        if taxonomy and taxonomy.export_id != self._export_id:
             raise ValidationError("ObjectTag's _export_id is out of sync with Taxonomy.export_id")
         if "," in self.object_id or "*" in self.object_id:
             # Some APIs may use these characters to allow wildcard matches or multiple matches in the future.
@@ -949,21 +1037,25 @@ class ObjectTag(models.Model):
         # We used to have code here that would try to find a new taxonomy if the current taxonomy has been deleted.
         # But for now that's removed, as it risks things like linking a tag to the wrong org's taxonomy.
 
+        # Load the related taxonomy just once; resync() runs in a loop over many ObjectTags,
+        # and every `self.taxonomy` access goes through the FK descriptor.
+        taxonomy = self.taxonomy
+
         # Sync the stored _export_id with the taxonomy.name
-        if self.taxonomy and self._export_id != self.taxonomy.export_id:
-            self.export_id = self.taxonomy.export_id
+        if taxonomy and self._export_id != taxonomy.export_id:
+            self.export_id = taxonomy.export_id
             changed = True
 
         # Sync taxonomy with matching _export_id
-        if not self.taxonomy:
+        if not taxonomy:
             taxonomy = Taxonomy.objects.filter(export_id=self.export_id).first()
             if taxonomy:
                 self.taxonomy = taxonomy
                 changed = True
 
         # Closed taxonomies require a tag matching _value
-        if self.taxonomy and not self.taxonomy.allow_free_text and not self.tag_id:
-            tag = self.taxonomy.tag_set.filter(value=self.value).first()
+        if taxonomy and not taxonomy.allow_free_text and not self.tag_id:
+            tag = taxonomy.tag_set.filter(value=self.value).first()
             if tag:
                 self.tag = tag
                 changed = True
@@ -5,9 +5,12 @@ Models used by the Taxonomy import/export tasks.
 from datetime import datetime
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext as _
 from django.utils.translation import gettext_lazy
 
+from openedx_django_lib.fields import InternedCharField
+
 from .base import Taxonomy
 
 
@@ -39,13 +42,17 @@ class TagImportTask(models.Model):
         blank=True, default=None, help_text=gettext_lazy("Action execution logs")
     )
 
-    status = models.CharField(
+    # Interned because there are only five possible values, so bulk reads of
+    # task history shouldn't allocate a fresh str per row.
+    status = InternedCharField(
         max_length=20,
         choices=TagImportTaskState.choices,
         help_text=gettext_lazy("Task status"),
     )
 
-    creation_date = models.DateTimeField(auto_now_add=True)
+    # A plain default (rather than auto_now_add) so that bulk operations and
+    # tests can set the timestamp explicitly; save() behaves the same.
+    creation_date = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         indexes = [
@@ -74,7 +81,7 @@ class TagImportTask(models.Model):
         log_message = f"[{timestamp}] {message}\n"
         self.log += log_message
         if save:
-            self.save()
+            self.save(update_fields=["log"])
 
     def log_exception(self, exception: Exception):
         """
@@ -82,7 +89,7 @@ class TagImportTask(models.Model):
         """
         self.add_log(repr(exception), save=False)
         self.status = TagImportTaskState.ERROR.value
-        self.save()
+        self.save(update_fields=["log", "status"])
 
     def log_parser_start(self):
         """
@@ -101,9 +108,9 @@ class TagImportTask(models.Model):
         Handles parser errors by logging them and moving the task status to ERROR.
         """
         for error in errors:
-            self.add_log(f"{str(error)}", save=False)
+            self.add_log(str(error), save=False)
         self.status = TagImportTaskState.ERROR.value
-        self.save()
+        self.save(update_fields=["log", "status"])
 
     def log_start_planning(self):
         """
@@ -111,7 +118,7 @@ class TagImportTask(models.Model):
         """
         self.add_log(_("Starting plan actions"), save=False)
         self.status = TagImportTaskState.PLANNING.value
-        self.save()
+        self.save(update_fields=["log", "status"])
 
     def log_plan(self, plan, elapsed_time):
         """
@@ -120,7 +127,7 @@ class TagImportTask(models.Model):
         self.add_log(_("Plan finished. Time elapsed: ") + str(elapsed_time) + _(" seconds"))
         plan_str = plan.plan()
         self.log += f"\n{plan_str}\n"
-        self.save()
+        self.save(update_fields=["log"])
 
     def handle_plan_errors(self):
         """
@@ -128,7 +135,7 @@ class TagImportTask(models.Model):
         """
         # Error are logged with plan
         self.status = TagImportTaskState.ERROR.value
-        self.save()
+        self.save(update_fields=["status"])
 
     def log_start_execute(self):
         """
@@ -136,7 +143,7 @@ class TagImportTask(models.Model):
         """
         self.add_log(_("Starting execute actions"), save=False)
         self.status = TagImportTaskState.EXECUTING.value
-        self.save()
+        self.save(update_fields=["log", "status"])
 
     def log_end_execute(self, elapsed_time):
         self.add_log(_("Execute actions finished. Time elapsed: ") + str(elapsed_time) + _(" seconds"))
@@ -147,4 +154,4 @@ class TagImportTask(models.Model):
         """
         self.add_log(_("Execution finished. Total time elapsed: ") + str(elapsed_time) + _("seconds"), save=False)
         self.status = TagImportTaskState.SUCCESS.value
-        self.save()
+        self.save(update_fields=["log", "status"])
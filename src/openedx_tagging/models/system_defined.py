@@ -3,6 +3,7 @@ Tagging app system-defined taxonomies data models
 """
 from __future__ import annotations
 
+import functools
 import logging
 
 from django.conf import settings
@@ -17,6 +18,31 @@ from .base import Tag, Taxonomy
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _language_dict(languages: tuple[tuple[str, str], ...]) -> dict[str, str]:
+    """
+    ``dict(languages)`` built once per distinct LANGUAGES value.
+
+    The cache is keyed on the setting value itself, so tests that override
+    LANGUAGES just get a separate entry; in a normal process the setting never
+    changes and the dict is built once instead of on every validation call.
+    """
+    return dict(languages)
+
+
+def get_language_dict() -> dict[str, str]:
+    """
+    Get settings.LANGUAGES (a list of tuples) as a dict of code -> name.
+
+    In LMS/CMS this is already cached as settings.LANGUAGE_DICT, which takes
+    precedence when present.
+    """
+    languages_as_dict = getattr(settings, "LANGUAGE_DICT", None)
+    if languages_as_dict is not None:
+        return languages_as_dict
+    return _language_dict(tuple((code, name) for code, name in settings.LANGUAGES))
+
+
 class SystemDefinedTaxonomy(Taxonomy):
     """
     Simple subclass of Taxonomy which requires the system_defined flag to be set.
@@ -221,9 +247,7 @@ class LanguageTaxonomy(SystemDefinedTaxonomy):
         Check if 'external_id' is part of this Taxonomy.
         """
         lang_code = external_id.lower()
-        # Get settings.LANGUAGES (a list of tuples) as a dict. In LMS/CMS this is already cached as LANGUAGE_DICT
-        languages_as_dict = getattr(settings, "LANGUAGE_DICT", dict(settings.LANGUAGES))
-        return lang_code in languages_as_dict
+        return lang_code in get_language_dict()
 
     def tag_for_external_id(self, external_id: str):
         """
@@ -234,10 +258,8 @@ class LanguageTaxonomy(SystemDefinedTaxonomy):
         Will raise Tag.DoesNotExist if the tag is not valid for this taxonomy.
         """
         lang_code = external_id.lower()
-        # Get settings.LANGUAGES (a list of tuples) as a dict. In LMS/CMS this is already cached as LANGUAGE_DICT
-        languages_as_dict = getattr(settings, "LANGUAGE_DICT", dict(settings.LANGUAGES))
         try:
-            lang_name = languages_as_dict[lang_code]
+            lang_name = get_language_dict()[lang_code]
         except KeyError as exc:
             raise Tag.DoesNotExist from exc
         tag, _created = self.tag_set.get_or_create(external_id=lang_code, defaults={"value": lang_name})
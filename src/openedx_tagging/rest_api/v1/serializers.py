@@ -3,6 +3,7 @@ API Serializers for taxonomies
 """
 from __future__ import annotations
 
+import re
 from typing import Any, Type
 from urllib.parse import urlencode
 
@@ -17,6 +18,11 @@ from openedx_tagging.rules import ObjectTagPermissionItem
 
 from ..utils import UserPermissionsHelper
 
+# Compiled once at import so every TaxonomyExportQueryParamsSerializer instance
+# shares one pattern object, rather than each field's validator holding its own
+# lazily-compiled copy of the same pattern string.
+EXPORT_FORMAT_REGEX = re.compile(r"^(json|csv)$", re.IGNORECASE)
+
 
 class TaxonomyListQueryParamsSerializer(serializers.Serializer):  # pylint: disable=abstract-method
     """
@@ -31,7 +37,7 @@ class TaxonomyExportQueryParamsSerializer(serializers.Serializer):  # pylint: di
     Serializer for the query params for the GET view
     """
     download = serializers.BooleanField(required=False, default=False)
-    output_format = serializers.RegexField(r"(?i)^(json|csv)$", allow_blank=False)
+    output_format = serializers.RegexField(EXPORT_FORMAT_REGEX, allow_blank=False)
 
 
 class UserPermissionsSerializerMixin(UserPermissionsHelper):
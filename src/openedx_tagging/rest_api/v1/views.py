@@ -232,9 +232,17 @@ class TaxonomyView(ModelViewSet):
         permissions.
         """
         pk = int(self.kwargs["pk"])
-        taxonomy = get_taxonomy(pk)
+        # Annotate the tags count here so the serializer doesn't have to issue
+        # a separate COUNT query for it (see TaxonomySerializer.get_tags_count).
+        taxonomy = (
+            Taxonomy.objects
+            .annotate(tags_count=models.Count("tag", distinct=True))
+            .filter(pk=pk)
+            .first()
+        )
         if not taxonomy:
             raise Http404("Taxonomy not found")
+        taxonomy = taxonomy.cast()
         self.check_object_permissions(self.request, taxonomy)
 
         return taxonomy
@@ -0,0 +1,45 @@
+"""
+Tagging celery tasks
+"""
+from __future__ import annotations
+
+from celery import shared_task  # type: ignore[import]
+from django.core.cache import cache
+
+import openedx_tagging.api as tagging_api
+
+from .models import ObjectTag
+
+# How long (in seconds) a full resync "holds the lease" before another full
+# resync task is allowed to run. Taxonomy imports can queue several full
+# resyncs back to back; runs within this window are redundant.
+RESYNC_DEBOUNCE_SECONDS = 2
+
+
+@shared_task
+def resync_object_tags_task(object_tag_ids: list[int] | None = None) -> int:
+    """
+    Runs resync_object_tags on a celery task
+
+    Resyncing every object tag can be slow, so consumers that trigger a resync
+    from a request path (e.g. after a taxonomy import) can use this task to
+    move that work off the request thread.
+
+    Full resyncs queued within ``RESYNC_DEBOUNCE_SECONDS`` of each other are
+    coalesced into one run, using `cache.add` as a short lease.
+
+    Pass `object_tag_ids` to limit the resync to specific object tags.
+    """
+    object_tags = None
+    if object_tag_ids is not None:
+        object_tags = ObjectTag.objects.filter(id__in=object_tag_ids).select_related("tag", "taxonomy")
+    elif not cache.add("oel_tagging:resync_object_tags:lease", 1, timeout=RESYNC_DEBOUNCE_SECONDS):
+        # Another full resync started less than RESYNC_DEBOUNCE_SECONDS ago,
+        # so don't repeat the full table scan. Note that the lease is taken
+        # when a run starts: a resync requested for changes made *after* that
+        # run's scan but within the window is dropped here, and those rows
+        # wait for the next requested resync. That's acceptable for this
+        # reconciliation task; shrink RESYNC_DEBOUNCE_SECONDS before reaching
+        # for a fancier scheme if it ever isn't.
+        return 0
+    return tagging_api.resync_object_tags(object_tags)
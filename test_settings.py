@@ -62,6 +62,13 @@ AUTHENTICATION_BACKENDS = [
     'rules.permissions.ObjectPermissionBackend',
 ]
 
+# Tests create throwaway users (e.g. in setUpTestData), and the default
+# PBKDF2 hasher burns hundreds of ms per password on purpose. MD5 is fine
+# for credentials that only ever live in a test database.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
 LOCALE_PATHS = [
     root("conf", "locale"),
 ]
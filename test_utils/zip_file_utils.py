@@ -2,18 +2,18 @@
 
 import io
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 
 
-def folder_to_inmemory_zip(folder_path: str) -> zipfile.ZipFile:
+@lru_cache(maxsize=None)
+def _folder_zip_bytes(folder_path: str) -> bytes:
     """
-    Read the contents of a folder and returns an in-memory ZipFile object.
-
-    Args:
-        folder_path (str): Path to the folder to zip.
+    Zip the contents of a folder and return the raw bytes.
 
-    Returns:
-        zipfile.ZipFile: An in-memory ZipFile containing the folder's contents.
+    Cached by path: the folders we zip are static test fixtures, and walking
+    and deflate-compressing them is deterministic, so tests that ask for the
+    same folder repeatedly only pay for the work once per process.
     """
     buffer = io.BytesIO()
     folder = Path(folder_path)
@@ -22,5 +22,20 @@ def folder_to_inmemory_zip(folder_path: str) -> zipfile.ZipFile:
             if file_path.is_file():
                 arcname = file_path.relative_to(folder)
                 zipf.write(file_path, arcname=str(arcname))
-    buffer.seek(0)
-    return zipfile.ZipFile(buffer, "r")
+    return buffer.getvalue()
+
+
+def folder_to_inmemory_zip(folder_path: str) -> zipfile.ZipFile:
+    """
+    Read the contents of a folder and returns an in-memory ZipFile object.
+
+    Args:
+        folder_path (str): Path to the folder to zip.
+
+    Returns:
+        zipfile.ZipFile: An in-memory ZipFile containing the folder's contents.
+        Each call returns a fresh ZipFile (so read position and handle state
+        aren't shared between tests), but repeat calls for the same folder
+        reuse the zipped bytes.
+    """
+    return zipfile.ZipFile(io.BytesIO(_folder_zip_bytes(folder_path)), "r")
@@ -20,12 +20,18 @@ User = get_user_model()
 class RestoreTestCase(TestCase):
     """Base test case for restore tests."""
 
+    @classmethod
+    def setUpTestData(cls):
+        # Create the user once per class instead of once per test.
+        super().setUpTestData()
+        cls.user = User.objects.create_user(username='lp_user', password='12345')
+
     def setUp(self):
         super().setUp()
         self.fixtures_folder = os.path.join(os.path.dirname(__file__), "fixtures/library_backup")
+        # The ZipFile carries open-handle state, so each test gets a fresh one.
         self.zip_file = folder_to_inmemory_zip(self.fixtures_folder)
         self.lp_key = "lib:WGU:LIB_C001"
-        self.user = User.objects.create_user(username='lp_user', password='12345')
 
 
 class RestoreLearningPackageCommandTest(RestoreTestCase):
@@ -2,6 +2,7 @@
 Basic tests of the Collections API.
 """
 from datetime import datetime, timezone
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User as UserType  # pylint: disable=imported-auth-user
@@ -109,6 +110,10 @@ class GetCollectionTestCase(CollectionsTestCase):
         """
         collection = api.get_collection(self.learning_package.pk, 'COL1')
         assert collection == self.collection1
+        # The lookup select-relates the learning package, so following the
+        # relation must not cost another query.
+        with self.assertNumQueries(0):
+            assert collection.learning_package.key == self.learning_package.key
 
     def test_get_collection_not_found(self):
         """
@@ -187,7 +192,11 @@ class CollectionCreateTestCase(CollectionTestCase):
             email="user@example.com",
         )
         created_time = datetime(2024, 8, 8, tzinfo=timezone.utc)
-        with freeze_time(created_time):
+        # The created/modified fields under test read django.utils.timezone.now
+        # directly, so patching it is enough here and much cheaper than
+        # freeze_time, which rewires datetime globally. Tests that pin
+        # api-level datetime.now() calls still need freeze_time.
+        with mock.patch("django.utils.timezone.now", return_value=created_time):
             collection = api.create_collection(
                 self.learning_package.id,
                 key='MYCOL',
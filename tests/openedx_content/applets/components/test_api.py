@@ -92,6 +92,34 @@ class PerformanceTestCase(ComponentTestCase):
             assert draft.title == published.title
             assert component.versioning.last_publish_log.published_at == self.now
 
+    def test_component_lookup_num_queries(self) -> None:
+        """
+        Key-based lookups should cost one query each, like pk lookups.
+        """
+        component, _version = components_api.create_component_and_version(
+            self.learning_package.id,
+            component_type=self.problem_type,
+            local_key="Query Counting",
+            title="Querying Counting Problem",
+            created=self.now,
+            created_by=None,
+        )
+
+        with self.assertNumQueries(1):
+            assert component == components_api.get_component_by_key(
+                self.learning_package.id,
+                namespace="xblock.v1",
+                type_name="problem",
+                local_key="Query Counting",
+            )
+        with self.assertNumQueries(1):
+            assert components_api.component_exists_by_key(
+                self.learning_package.id,
+                namespace="xblock.v1",
+                type_name="problem",
+                local_key="Query Counting",
+            )
+
 
 class GetComponentsTestCase(ComponentTestCase):
     """
@@ -0,0 +1,62 @@
+"""
+Tests for the media Django admin helpers
+"""
+import base64
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from openedx_content.applets.media import api as media_api
+from openedx_content.applets.media.admin import MAX_CACHED_PREVIEW_SIZE, base64_data_for_media
+from openedx_content.applets.publishing import api as publishing_api
+
+FILE_DATA = b"<html>hello world!</html>"
+
+
+class Base64DataForMediaTestCase(TestCase):
+    """
+    Test the caching behavior of base64_data_for_media().
+    """
+    def setUp(self) -> None:
+        super().setUp()
+        # The default locmem cache outlives the per-test transaction:
+        self.addCleanup(cache.clear)
+        learning_package = publishing_api.create_learning_package(
+            key="Base64DataForMediaTestCase-test-key",
+            title="Media Admin Test Learning Package",
+        )
+        media_type = media_api.get_or_create_media_type("text/html")
+        self.media = media_api.get_or_create_file_media(
+            learning_package.id,
+            media_type.id,
+            data=FILE_DATA,
+            created=datetime.now(tz=timezone.utc),
+        )
+
+    def test_encodes_and_caches(self):
+        """
+        A small file is encoded correctly and the preview lands in the cache.
+        """
+        expected = base64.b64encode(FILE_DATA).decode("utf8")
+        assert base64_data_for_media(self.media) == expected
+        assert cache.get(f"media_preview_b64:{self.media.hash_digest}") == expected
+
+    def test_cache_hit_skips_encoding(self):
+        """
+        A second call reuses the cached preview instead of re-encoding the file.
+        """
+        expected = base64_data_for_media(self.media)
+        with patch("openedx_content.applets.media.admin._encode_media_file") as mock_encode:
+            assert base64_data_for_media(self.media) == expected
+        mock_encode.assert_not_called()
+
+    def test_large_files_not_cached(self):
+        """
+        Files over the size cutoff are encoded but never cached.
+        """
+        self.media.size = MAX_CACHED_PREVIEW_SIZE + 1
+        expected = base64.b64encode(FILE_DATA).decode("utf8")
+        assert base64_data_for_media(self.media) == expected
+        assert cache.get(f"media_preview_b64:{self.media.hash_digest}") is None
@@ -9,7 +9,9 @@ from uuid import UUID
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from openedx_content.applets.publishing import api as publishing_api
 from openedx_content.applets.publishing.models import (
@@ -171,6 +173,43 @@ class DraftTestCase(TestCase):
         deleted_entity_version = publishing_api.get_draft_version(entity.id)
         assert deleted_entity_version is None
 
+    def test_publish_all_drafts_query_scaling(self) -> None:
+        """
+        Track how many queries publishing costs per entity.
+
+        publish_all_drafts currently runs a fixed number of setup queries
+        plus a marginal number per entity published. Capture the counts for a
+        small and a larger batch and pin the marginal cost, so a query
+        creeping into the per-entity publish path fails loudly here — and so
+        an improvement gets recorded by lowering the pinned number.
+        """
+        def _create_drafts(learning_package_id: int, count: int) -> None:
+            for num in range(count):
+                entity = publishing_api.create_publishable_entity(
+                    learning_package_id,
+                    f"entity_{num}",
+                    created=self.now,
+                    created_by=None,
+                )
+                publishing_api.create_publishable_entity_version(
+                    entity.id,
+                    version_num=1,
+                    title=f"Entity {num} 🌴",
+                    created=self.now,
+                    created_by=None,
+                )
+
+        _create_drafts(self.learning_package_1.id, 2)
+        _create_drafts(self.learning_package_2.id, 10)
+
+        with CaptureQueriesContext(connection) as small_batch:
+            publishing_api.publish_all_drafts(self.learning_package_1.id, published_at=self.now)
+        with CaptureQueriesContext(connection) as large_batch:
+            publishing_api.publish_all_drafts(self.learning_package_2.id, published_at=self.now)
+
+        queries_per_entity = (len(large_batch) - len(small_batch)) / (10 - 2)
+        assert queries_per_entity == 14
+
     def test_set_draft_args(self) -> None:
         """Make sure it works with Draft and int, and raises exception otherwise"""
         entity = publishing_api.create_publishable_entity(
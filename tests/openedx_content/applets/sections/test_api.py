@@ -8,16 +8,13 @@ from django.core.exceptions import ValidationError
 import openedx_content.api as content_api
 from openedx_content import models_api as authoring_models
 
-from ..subsections.test_api import SubSectionTestCase
+from ..subsections.test_api import SubSectionTestMixin
 
 Entry = content_api.SectionListEntry
 
 
-# TODO: Turn SubSectionTestCase into SubSectionTestMixin and remove the
-# test-inherits-tests pylint warning below.
-# https://github.com/openedx/openedx-core/issues/308
 @ddt.ddt
-class SectionTestCase(SubSectionTestCase):  # pylint: disable=test-inherits-tests
+class SectionTestCase(SubSectionTestMixin):
     """ Test cases for Sections (containers of subsections) """
 
     def setUp(self) -> None:
@@ -11,17 +11,18 @@ from django.db import IntegrityError
 import openedx_content.api as content_api
 from openedx_content import models_api as authoring_models
 
-from ..units.test_api import UnitTestCase
+from ..units.test_api import UnitTestMixin
 
 Entry = content_api.SubsectionListEntry
 
 
-# TODO: Turn UnitTestCase into UnitTestMixin and remove the
-# test-inherits-tests pylint warning below.
-# https://github.com/openedx/openedx-core/issues/308
-@ddt.ddt
-class SubSectionTestCase(UnitTestCase):  # pylint: disable=test-inherits-tests
-    """ Test cases for Subsections (containers of units) """
+class SubSectionTestMixin(UnitTestMixin):
+    """
+    Fixtures and helpers for tests that work with subsections.
+
+    Holds no tests itself, so the section test case can inherit the
+    fixtures without re-running the whole subsection test suite.
+    """
 
     def setUp(self) -> None:
         super().setUp()
@@ -92,6 +93,11 @@ class SubSectionTestCase(UnitTestCase):  # pylint: disable=test-inherits-tests
             ),
         )
 
+
+@ddt.ddt
+class SubSectionTestCase(SubSectionTestMixin):
+    """ Test cases for Subsections (containers of units) """
+
     def test_get_subsection(self):
         """
         Test get_subsection()
@@ -263,7 +269,7 @@ class SubSectionTestCase(UnitTestCase):  # pylint: disable=test-inherits-tests
             )
 
     @patch('openedx_content.applets.subsections.api._pub_entities_for_units')
-    def test_adding_mismatched_versions(self, mock_entities_for_units):  # pylint: disable=arguments-renamed
+    def test_adding_mismatched_versions(self, mock_entities_for_units):
         """
         Test that versioned units must match their entities.
         """
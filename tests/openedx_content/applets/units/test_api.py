@@ -16,20 +16,27 @@ from ..components.test_api import ComponentTestCase
 Entry = content_api.UnitListEntry
 
 
-@ddt.ddt
-class UnitTestCase(ComponentTestCase):
-    """ Test cases for Units (containers of components) """
+class UnitTestMixin(ComponentTestCase):
+    """
+    Fixtures and helpers for tests that work with units.
+
+    Holds no tests itself, so the subsection and section test cases can
+    inherit the fixtures without re-running the whole unit test suite.
+    """
 
     def setUp(self) -> None:
         super().setUp()
-        self.component_1, self.component_1_v1 = self.create_component(
-            key="Query Counting",
-            title="Querying Counting Problem",
-        )
-        self.component_2, self.component_2_v1 = self.create_component(
-            key="Query Counting (2)",
-            title="Querying Counting Problem (2)",
-        )
+        # Batch both setup creates into a single changeset/transaction rather
+        # than paying the per-create draft-change bookkeeping twice.
+        with content_api.bulk_draft_changes_for(self.learning_package.id):
+            self.component_1, self.component_1_v1 = self.create_component(
+                key="Query Counting",
+                title="Querying Counting Problem",
+            )
+            self.component_2, self.component_2_v1 = self.create_component(
+                key="Query Counting (2)",
+                title="Querying Counting Problem (2)",
+            )
 
     def create_component(self, *, title: str = "Test Component", key: str = "component:1") -> tuple[
         authoring_models.Component, authoring_models.ComponentVersion
@@ -80,6 +87,11 @@ class UnitTestCase(ComponentTestCase):
             created_by=None,
         )
 
+
+@ddt.ddt
+class UnitTestCase(UnitTestMixin):
+    """ Test cases for Units (containers of components) """
+
     def test_get_unit(self):
         """
         Test get_unit()
@@ -11,6 +11,13 @@ class TestImportExportMixin:
 
     fixtures = ["tests/openedx_tagging/fixtures/tagging.yaml"]
 
-    def setUp(self):
-        self.taxonomy = Taxonomy.objects.get(name="Import Taxonomy Test")
-        return super().setUp()
+    taxonomy: Taxonomy
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Fetch the fixture taxonomy once per class rather than re-querying
+        it in setUp for every test.
+        """
+        cls.taxonomy = Taxonomy.objects.get(name="Import Taxonomy Test")
+        super().setUpTestData()
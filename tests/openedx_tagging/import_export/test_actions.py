@@ -27,7 +27,9 @@ class TestImportActionMixin(TestImportExportMixin):
     indexed_actions: dict[str, list[ImportAction]]
 
     def setUp(self) -> None:  # Note: we must specify '-> None' to opt in to type checking
-        super().setUp()
+        # The mixin has no setUp of its own; this resolves to TestCase once
+        # the class is mixed into one.
+        super().setUp()  # type: ignore[misc]
         self.indexed_actions = {
             'create': [
                 CreateTag(
@@ -267,6 +269,7 @@ class TestCreateTag(TestImportActionMixin, TestCase):
         tag_obj = self.taxonomy.tag_set.get(external_id=tag_id)
         assert tag_obj.value == value
         if parent_id:
+            assert tag_obj.parent
             assert tag_obj.parent.external_id == parent_id
         else:
             assert tag_obj.parent is None
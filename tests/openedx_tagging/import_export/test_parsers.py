@@ -166,6 +166,7 @@ class TestJSONParser(TestImportExportMixin, TestCase):
             taxonomy_tag = self.taxonomy.tag_set.get(external_id=tag.get("id"))
             assert tag.get("value") == taxonomy_tag.value
             if tag.get("parent_id"):
+                assert taxonomy_tag.parent
                 assert tag.get("parent_id") == taxonomy_tag.parent.external_id
 
     def test_import_with_export_output(self) -> None:
@@ -312,4 +313,5 @@ class TestCSVParser(TestImportExportMixin, TestCase):
             taxonomy_tag = self.taxonomy.tag_set.get(external_id=tag.id)
             assert tag.value == taxonomy_tag.value
             if tag.parent_id:
+                assert taxonomy_tag.parent
                 assert tag.parent_id == taxonomy_tag.parent.external_id
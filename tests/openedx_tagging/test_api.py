@@ -329,6 +329,42 @@ class TestApiTagging(TestTagTaxonomyMixin, TestCase):
         changed = tagging_api.resync_object_tags()
         assert changed == 0
 
+    def test_resync_object_tags_case_only_rename(self) -> None:
+        """
+        A rename that only changes casing must still be resynced.
+
+        The tag value columns have case-insensitive collations, so this guards
+        against the full-resync prefilter treating "Bacteria" == "BACTERIA"
+        and skipping the row.
+        """
+        object_id = "obj1"
+        tagging_api.tag_object(object_id, self.taxonomy, [self.bacteria.value])
+
+        Tag.objects.filter(pk=self.bacteria.pk).update(value="BACTERIA")
+
+        changed = tagging_api.resync_object_tags()
+        assert changed == 1
+        assert [t.value for t in tagging_api.get_object_tags(object_id)] == ["BACTERIA"]
+
+    def test_update_tag_in_taxonomy_case_only_rename(self) -> None:
+        """
+        A case-only rename through update_tag_in_taxonomy must be resynced.
+
+        Tag lookups are case-insensitive, so passing the same string for both
+        values can still rename the stored tag ("Bacteria" -> "bacteria"
+        here); the no-op skip must not leave the ObjectTags stale.
+        """
+        object_id = "obj1"
+        tagging_api.tag_object(object_id, self.taxonomy, [self.bacteria.value])
+
+        updated_tag = tagging_api.update_tag_in_taxonomy(self.taxonomy, "bacteria", "bacteria")
+
+        assert updated_tag.value == "bacteria"
+        # The cached value column must follow the rename too:
+        assert list(
+            ObjectTag.objects.filter(object_id=object_id).values_list("_value", flat=True)
+        ) == ["bacteria"]
+
     def test_resync_object_tags_without_tag(self) -> None:
         # Create object tag with an invalid tag
         tag_value = "Eukaryota Xenomorph"
@@ -656,7 +692,7 @@ class TestApiTagging(TestTagTaxonomyMixin, TestCase):
             for object_tag in object_tags:
                 object_tag.full_clean()  # Check full model validation
                 assert object_tag.tag
-                assert object_tag.tag.external_id == str(user.id)
+                assert object_tag.tag.external_id == str(user.pk)
                 assert object_tag.tag.value == user.username
                 assert not object_tag.is_deleted
                 assert object_tag.taxonomy == self.user_taxonomy
@@ -918,7 +954,7 @@ class TestApiTagging(TestTagTaxonomyMixin, TestCase):
         obj1 = "object_id1"
         obj2 = "object_id2"
 
-        tags_list = [
+        tags_list: list[dict[str, Any]] = [
             {
                 "value": "English",
                 "taxonomy": self.language_taxonomy,
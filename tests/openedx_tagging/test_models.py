@@ -6,13 +6,14 @@ from __future__ import annotations
 import ddt  # type: ignore[import]
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
-from django.db import transaction
 from django.db.utils import IntegrityError
 from django.test.testcases import TestCase
 
 from openedx_tagging import api
 from openedx_tagging.models import LanguageTaxonomy, ObjectTag, Tag, Taxonomy
+from openedx_tagging.models.base import EXPORT_ID_REGEX
 from openedx_tagging.models.utils import RESERVED_TAG_CHARS
 
 from .utils import pretty_format_tags
@@ -32,45 +33,72 @@ class TestTagTaxonomyMixin:
 
     fixtures = ["tests/openedx_tagging/fixtures/tagging.yaml"]
 
-    def setUp(self):
-        super().setUp()
+    taxonomy: Taxonomy
+    system_taxonomy: Taxonomy
+    language_taxonomy: LanguageTaxonomy
+    user_taxonomy: Taxonomy
+    free_text_taxonomy: Taxonomy
+    import_taxonomy: Taxonomy
+    archaea: Tag
+    archaebacteria: Tag
+    bacteria: Tag
+    eubacteria: Tag
+    chordata: Tag
+    mammalia: Tag
+    animalia: Tag
+    system_taxonomy_tag: Tag
+    english_tag: Tag
+    user_1: AbstractUser
+    user_2: AbstractUser
+    filtered_tags: list[Tag]
+    system_tags: list[Tag]
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Load the shared taxonomies, tags, and users once per test class
+        rather than once per test. The class-wide transaction restores this
+        state between tests, and Django hands each test its own copies of
+        these attributes, so tests can still mutate them freely.
+        """
+        super().setUpTestData()
         # Core pre-defined taxonomies for testing:
-        self.taxonomy = Taxonomy.objects.get(name="Life on Earth")
-        self.system_taxonomy = Taxonomy.objects.get(name="System defined taxonomy")
-        self.language_taxonomy = LanguageTaxonomy.objects.get(name="Languages")
-        self.user_taxonomy = Taxonomy.objects.get(name="User Authors").cast()
-        self.free_text_taxonomy = api.create_taxonomy(name="Free Text", allow_free_text=True)
-        self.import_taxonomy = Taxonomy.objects.get(name="Import Taxonomy Test")
+        cls.taxonomy = Taxonomy.objects.get(name="Life on Earth")
+        cls.system_taxonomy = Taxonomy.objects.get(name="System defined taxonomy")
+        cls.language_taxonomy = LanguageTaxonomy.objects.get(name="Languages")
+        cls.user_taxonomy = Taxonomy.objects.get(name="User Authors").cast()
+        cls.free_text_taxonomy = api.create_taxonomy(name="Free Text", allow_free_text=True)
+        cls.import_taxonomy = Taxonomy.objects.get(name="Import Taxonomy Test")
 
         # References to some tags:
-        self.archaea = get_tag("Archaea")
-        self.archaebacteria = get_tag("Archaebacteria")
-        self.bacteria = get_tag("Bacteria")
-        self.eubacteria = get_tag("Eubacteria")
-        self.chordata = get_tag("Chordata")
-        self.mammalia = get_tag("Mammalia")
-        self.animalia = get_tag("Animalia")
-        self.system_taxonomy_tag = get_tag("System Tag 1")
-        self.english_tag = self.language_taxonomy.tag_for_external_id("en")
-        self.user_1 = get_user_model()(
+        cls.archaea = get_tag("Archaea")
+        cls.archaebacteria = get_tag("Archaebacteria")
+        cls.bacteria = get_tag("Bacteria")
+        cls.eubacteria = get_tag("Eubacteria")
+        cls.chordata = get_tag("Chordata")
+        cls.mammalia = get_tag("Mammalia")
+        cls.animalia = get_tag("Animalia")
+        cls.system_taxonomy_tag = get_tag("System Tag 1")
+        cls.english_tag = cls.language_taxonomy.tag_for_external_id("en")
+        cls.user_1 = get_user_model()(
             id=1,
             username="test_user_1",
         )
-        self.user_1.save()
-        self.user_2 = get_user_model()(
+        cls.user_1.save()
+        cls.user_2 = get_user_model()(
             id=2,
             username="test_user_2",
         )
-        self.user_2.save()
+        cls.user_2.save()
 
         # Biology tags that contains 'eu'
-        self.filtered_tags = [
+        cls.filtered_tags = [
             get_tag("Eubacteria"),
             get_tag("Eukaryota"),
             get_tag("Euryarchaeida"),
         ]
 
-        self.system_tags = [
+        cls.system_tags = [
             get_tag("System Tag 1"),
             get_tag("System Tag 2"),
             get_tag("System Tag 3"),
@@ -111,20 +139,27 @@ class TestTagTaxonomyMixin:
         """
         Helper method to create 100 taxonomies and to apply a tag from each to an object
         """
-        dummy_taxonomies = []
-        for i in range(100):
-            taxonomy = api.create_taxonomy(
+        # Two multi-row INSERTs instead of 100 create_taxonomy() calls and 100
+        # ObjectTag saves; these tests only need the rows to exist.
+        next_export_num = Taxonomy.objects.count() + 1
+        dummy_taxonomies = Taxonomy.objects.bulk_create([
+            Taxonomy(
                 name=f"ZZ Dummy Taxonomy {i:03}",
                 allow_free_text=True,
                 allow_multiple=True,
+                export_id=f"{next_export_num + i}-zz-dummy-taxonomy-{i:03}",
             )
-            ObjectTag.objects.create(
+            for i in range(100)
+        ])
+        ObjectTag.objects.bulk_create([
+            ObjectTag(
                 object_id="limit_tag_count",
                 taxonomy=taxonomy,
                 _export_id=taxonomy.export_id,
                 _value="Dummy Tag",
             )
-            dummy_taxonomies.append(taxonomy)
+            for taxonomy in dummy_taxonomies
+        ])
         return dummy_taxonomies
 
 
@@ -259,13 +294,23 @@ class TestTagTaxonomy(TestTagTaxonomyMixin, TestCase):
         t2 = api.add_tag_to_taxonomy(self.taxonomy, "\t value\n")
         assert t2.value == "value"
 
-    def test_reserved_chars(self):
-        for reserved_char in RESERVED_TAG_CHARS:
-            with pytest.raises(ValidationError):
-                self.taxonomy.add_tag(f"tag 1 {reserved_char} tag 2")
-            # And via the API:
-            with pytest.raises(ValidationError):
-                api.add_tag_to_taxonomy(self.taxonomy, f"tag 3 {reserved_char} tag 4")
+    @ddt.data(*RESERVED_TAG_CHARS)
+    def test_reserved_chars(self, reserved_char):
+        # The reserved-char rule lives in Tag.clean(), which is pure Python,
+        # so run the matrix against unsaved instances and leave the database
+        # out of it. test_reserved_chars_wiring covers the add_tag paths.
+        with pytest.raises(ValidationError):
+            Tag(taxonomy=self.taxonomy, value=f"tag 1 {reserved_char} tag 2").clean()
+
+    def test_reserved_chars_wiring(self):
+        """
+        One end-to-end check that both add_tag entry points run Tag.clean().
+        """
+        with pytest.raises(ValidationError):
+            self.taxonomy.add_tag("tag 1 ; tag 2")
+        # And via the API:
+        with pytest.raises(ValidationError):
+            api.add_tag_to_taxonomy(self.taxonomy, "tag 3 ; tag 4")
 
     @ddt.data(
         ("test"),
@@ -280,8 +325,10 @@ class TestTagTaxonomy(TestTagTaxonomyMixin, TestCase):
         ("123456789"),
     )
     def test_export_id_format_valid(self, export_id):
-        self.taxonomy.export_id = export_id
-        self.taxonomy.full_clean()
+        # Check the format against the regex directly; full_clean() would
+        # re-run every field validator (plus a uniqueness query) per case.
+        # test_export_id_validation_wiring covers the field wiring.
+        assert EXPORT_ID_REGEX.match(export_id)
 
     @ddt.data(
         ("LightCast Skills"),
@@ -293,7 +340,16 @@ class TestTagTaxonomy(TestTagTaxonomyMixin, TestCase):
         (" test"),
     )
     def test_export_id_format_invalid(self, export_id):
-        self.taxonomy.export_id = export_id
+        assert not EXPORT_ID_REGEX.match(export_id)
+
+    def test_export_id_validation_wiring(self):
+        """
+        One end-to-end check that full_clean() enforces the export_id format.
+        """
+        self.taxonomy.export_id = "lightcast-skills"
+        self.taxonomy.full_clean()
+
+        self.taxonomy.export_id = "LightCast Skills"
         with pytest.raises(ValidationError):
             self.taxonomy.full_clean()
 
@@ -325,7 +381,7 @@ class TestFilteredTagsClosedTaxonomy(TestTagTaxonomyMixin, TestCase):
         result = list(self.taxonomy.get_filtered_tags(depth=1, include_counts=False))
         common_fields = {"depth": 0, "parent_value": None, "external_id": None}
         for r in result:
-            del r["_id"]  # Remove the internal database IDs; they aren't interesting here and a other tests check them
+            del r["_id"]  # type: ignore[misc]  # The internal database IDs aren't interesting here
         assert result == [
             # These are the root tags, in alphabetical order:
             {"value": "Archaea", "child_count": 3, "descendant_count": 3, **common_fields},
@@ -341,7 +397,7 @@ class TestFilteredTagsClosedTaxonomy(TestTagTaxonomyMixin, TestCase):
         result = list(self.taxonomy.get_filtered_tags(depth=1, parent_tag_value="Eukaryota", include_counts=True))
         common_fields = {"depth": 1, "parent_value": "Eukaryota", "usage_count": 0, "external_id": None}
         for r in result:
-            del r["_id"]  # Remove the internal database IDs; they aren't interesting here and a other tests check them
+            del r["_id"]  # type: ignore[misc]  # The internal database IDs aren't interesting here
         assert result == [
             # These are the Eukaryota tags, in alphabetical order:
             {"value": "Animalia", "child_count": 7, "descendant_count": 8, **common_fields},
@@ -359,7 +415,7 @@ class TestFilteredTagsClosedTaxonomy(TestTagTaxonomyMixin, TestCase):
         result = list(self.taxonomy.get_filtered_tags(depth=1, parent_tag_value="Animalia"))
         common_fields = {"depth": 2, "parent_value": "Animalia", "external_id": None}
         for r in result:
-            del r["_id"]  # Remove the internal database IDs; they aren't interesting here and a other tests check them
+            del r["_id"]  # type: ignore[misc]  # The internal database IDs aren't interesting here
         assert result == [
             # These are the Eukaryota tags, in alphabetical order:
             {"value": "Arthropoda", "child_count": 0, "descendant_count": 0, **common_fields},
@@ -632,14 +688,26 @@ class TestFilteredTagsFreeTextTaxonomy(TestCase):
     Free text taxonomies only return tags that are actually used.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.taxonomy = api.create_taxonomy(allow_free_text=True, name="FreeText")
+    taxonomy: Taxonomy
+
+    # Fields identical for every free-text tag result; built once and only
+    # ever merged into expected dicts, never mutated.
+    common_fields = {"child_count": 0, "depth": 0, "parent_value": None, "external_id": None, "_id": None}
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the taxonomy and tags once for the whole class: these tests
+        only read, so each test can roll back to the shared savepoint instead
+        of re-running all of the inserts.
+        """
+        super().setUpTestData()
+        cls.taxonomy = api.create_taxonomy(allow_free_text=True, name="FreeText")
         # The "triple" tag will be applied to three objects, "double" to two, and "solo" to one:
-        api.tag_object(object_id="obj1", taxonomy=self.taxonomy, tags=["triple"])
-        api.tag_object(object_id="obj2", taxonomy=self.taxonomy, tags=["triple", "double"])
-        api.tag_object(object_id="obj3", taxonomy=self.taxonomy, tags=["triple", "double"])
-        api.tag_object(object_id="obj4", taxonomy=self.taxonomy, tags=["solo"])
+        api.tag_object(object_id="obj1", taxonomy=cls.taxonomy, tags=["triple"])
+        api.tag_object(object_id="obj2", taxonomy=cls.taxonomy, tags=["triple", "double"])
+        api.tag_object(object_id="obj3", taxonomy=cls.taxonomy, tags=["triple", "double"])
+        api.tag_object(object_id="obj4", taxonomy=cls.taxonomy, tags=["solo"])
 
     def test_get_filtered_tags(self):
         """
@@ -647,12 +715,11 @@ class TestFilteredTagsFreeTextTaxonomy(TestCase):
         Without counts included.
         """
         result = list(self.taxonomy.get_filtered_tags(include_counts=False))
-        common_fields = {"child_count": 0, "depth": 0, "parent_value": None, "external_id": None, "_id": None}
         assert result == [
             # These should appear in alphabetical order:
-            {"value": "double", **common_fields},
-            {"value": "solo", **common_fields},
-            {"value": "triple", **common_fields},
+            {"value": "double", **self.common_fields},
+            {"value": "solo", **self.common_fields},
+            {"value": "triple", **self.common_fields},
         ]
 
     def test_get_filtered_tags_with_count(self):
@@ -661,12 +728,11 @@ class TestFilteredTagsFreeTextTaxonomy(TestCase):
         Without counts included.
         """
         result = list(self.taxonomy.get_filtered_tags(include_counts=True))
-        common_fields = {"child_count": 0, "depth": 0, "parent_value": None, "external_id": None, "_id": None}
         assert result == [
             # These should appear in alphabetical order:
-            {"value": "double", "usage_count": 2, **common_fields},
-            {"value": "solo", "usage_count": 1, **common_fields},
-            {"value": "triple", "usage_count": 3, **common_fields},
+            {"value": "double", "usage_count": 2, **self.common_fields},
+            {"value": "solo", "usage_count": 1, **self.common_fields},
+            {"value": "triple", "usage_count": 3, **self.common_fields},
         ]
 
     def test_get_filtered_tags_num_queries(self):
@@ -684,29 +750,34 @@ class TestFilteredTagsFreeTextTaxonomy(TestCase):
         Test basic retrieval of only matching tags.
         """
         result1 = list(self.taxonomy.get_filtered_tags(search_term="le", include_counts=True))
-        common_fields = {"child_count": 0, "depth": 0, "parent_value": None, "external_id": None, "_id": None}
         assert result1 == [
             # These should appear in alphabetical order:
-            {"value": "double", "usage_count": 2, **common_fields},
-            {"value": "triple", "usage_count": 3, **common_fields},
+            {"value": "double", "usage_count": 2, **self.common_fields},
+            {"value": "triple", "usage_count": 3, **self.common_fields},
         ]
         # And it should be case insensitive:
         result2 = list(self.taxonomy.get_filtered_tags(search_term="LE", include_counts=True))
         assert result1 == result2
 
 
+@ddt.ddt
 class TestObjectTag(TestTagTaxonomyMixin, TestCase):
     """
     Test the ObjectTag model and the related Taxonomy methods and fields.
     """
 
-    def setUp(self):
-        super().setUp()
-        self.tag = self.bacteria
-        self.object_tag = ObjectTag.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the shared ObjectTag once per class; tests that mutate or
+        delete it only touch their own per-test copy and savepoint.
+        """
+        super().setUpTestData()
+        cls.tag = cls.bacteria
+        cls.object_tag = ObjectTag.objects.create(
             object_id="object:id:1",
-            taxonomy=self.taxonomy,
-            tag=self.tag,
+            taxonomy=cls.taxonomy,
+            tag=cls.tag,
         )
 
     def test_representations(self):
@@ -837,23 +908,21 @@ class TestObjectTag(TestTagTaxonomyMixin, TestCase):
         # Tag with object_id with upper case should not trigger IntegrityError
         api.tag_object("CASE:id:2", self.taxonomy, [self.chordata.value])
 
-        # Create another ObjectTag with lower case object_id should trigger IntegrityError
-        with transaction.atomic():
-            with pytest.raises(IntegrityError):
-                ObjectTag(
-                    object_id="case:id:2",
-                    taxonomy=self.taxonomy,
-                    tag=self.chordata,
-                ).save()
-
-        # Create another ObjectTag with upper case object_id should trigger IntegrityError
-        with transaction.atomic():
-            with pytest.raises(IntegrityError):
-                ObjectTag(
-                    object_id="CASE:id:2",
-                    taxonomy=self.taxonomy,
-                    tag=self.chordata,
-                ).save()
+    @ddt.data("case:id:2", "CASE:id:2")
+    def test_tag_case_duplicate(self, object_id):
+        """
+        Test that a second ObjectTag with the same-cased object_id fails.
+
+        Split out per case from test_tag_case so each duplicate check rides
+        on the test's own transaction instead of opening an inner savepoint.
+        """
+        api.tag_object(object_id, self.taxonomy, [self.chordata.value])
+        with pytest.raises(IntegrityError):
+            ObjectTag(
+                object_id=object_id,
+                taxonomy=self.taxonomy,
+                tag=self.chordata,
+            ).save()
 
     def test_invalid_id(self):
         """
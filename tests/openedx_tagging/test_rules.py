@@ -6,7 +6,7 @@ import rules  # type: ignore[import]
 from django.contrib.auth import get_user_model
 from django.test.testcases import TestCase
 
-from openedx_tagging.models import ObjectTag
+from openedx_tagging.models import ObjectTag, Tag, Taxonomy
 from openedx_tagging.rules import ObjectTagPermissionItem
 
 from .test_models import TestTagTaxonomyMixin
@@ -20,36 +20,45 @@ class TestRulesTagging(TestTagTaxonomyMixin, TestCase):
     Tests that the expected rules have been applied to the tagging models.
     """
 
-    def setUp(self):
-
-        def _object_permission(_user, object_id: str) -> bool:
-            """
-            Everyone have object permission on object_id "abc"
-            """
-            return object_id == "abc"
-
-        super().setUp()
-
-        self.superuser = User.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        # Create the shared users and ObjectTag once per class instead of per
+        # test; the class-wide transaction restores them between tests.
+        super().setUpTestData()
+        cls.superuser = User.objects.create(
             username="superuser",
             email="superuser@example.com",
             is_superuser=True,
         )
-        self.staff = User.objects.create(
+        cls.staff = User.objects.create(
             username="staff",
             email="staff@example.com",
             is_staff=True,
         )
-        self.learner = User.objects.create(
+        cls.learner = User.objects.create(
             username="learner",
             email="learner@example.com",
         )
-        self.object_tag = ObjectTag.objects.create(
-            taxonomy=self.taxonomy,
-            tag=self.bacteria,
+        cls.object_tag = ObjectTag.objects.create(
+            taxonomy=Taxonomy.objects.get(name="Life on Earth"),
+            tag=Tag.objects.get(value="Bacteria"),
             object_id="abc",
         )
-        self.object_tag.save()
+
+    def setUp(self):
+
+        def _object_permission(_user, object_id: str) -> bool:
+            """
+            Everyone have object permission on object_id "abc"
+            """
+            return object_id == "abc"
+
+        super().setUp()
+
+        # Tests mutate self.taxonomy (e.g. disabling it) and expect the
+        # ObjectTag to see the change, so point the per-class ObjectTag at
+        # this test's taxonomy instance.
+        self.object_tag.taxonomy = self.taxonomy
 
         # Override the object permission for the test
         rules.set_perm("oel_tagging.change_objecttag_objectid", _object_permission)
@@ -128,8 +128,8 @@ class TestModelSystemDefinedTaxonomy(TestTagTaxonomyMixin, TestCase):
         assert self.author_taxonomy.validate_value(self.user_2.username) is True
         assert self.author_taxonomy.validate_value("not a user") is False
         # And we can validate by ID if we want:
-        assert self.author_taxonomy.validate_external_id(str(self.user_1.id)) is True
-        assert self.author_taxonomy.validate_external_id(str(self.user_2.id)) is True
+        assert self.author_taxonomy.validate_external_id(str(self.user_1.pk)) is True
+        assert self.author_taxonomy.validate_external_id(str(self.user_2.pk)) is True
         assert self.author_taxonomy.validate_external_id("8742590") is False
 
     @ddt.data(
@@ -0,0 +1,99 @@
+"""
+Test tagging celery tasks
+"""
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test.testcases import TestCase
+
+import openedx_tagging.tasks as tagging_tasks
+from openedx_tagging import api
+from openedx_tagging.models import ObjectTag, Tag, Taxonomy
+
+
+class TestResyncObjectTagsTask(TestCase):
+    """
+    Test the resync celery task and its full-run debounce lease.
+    """
+
+    taxonomy: Taxonomy
+    tag: Tag
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Create the shared taxonomy and tag once per class.
+        """
+        super().setUpTestData()
+        cls.taxonomy = api.create_taxonomy(name="Resync Taxonomy")
+        cls.tag = Tag.objects.create(taxonomy=cls.taxonomy, value="resync tag")
+
+    def setUp(self):
+        super().setUp()
+        # The locmem cache (and so the debounce lease) outlives the per-test
+        # transaction:
+        self.addCleanup(cache.clear)
+
+    def _make_stale_object_tag(self, object_id: str) -> ObjectTag:
+        """
+        Apply self.tag to the given object, then make its cached value stale.
+        """
+        api.tag_object(object_id, self.taxonomy, [self.tag.value])
+        object_tag = ObjectTag.objects.get(object_id=object_id)
+        ObjectTag.objects.filter(pk=object_tag.pk).update(_value="stale value")
+        return object_tag
+
+    def _cached_value(self, object_tag: ObjectTag) -> str:
+        """
+        Read the cached _value column back from the database.
+        """
+        return ObjectTag.objects.values_list("_value", flat=True).get(pk=object_tag.pk)
+
+    def test_resync_given_ids(self):
+        """
+        An id-filtered call resyncs those rows and leaves the rest alone.
+        """
+        object_tag = self._make_stale_object_tag("obj1")
+        other_tag = self._make_stale_object_tag("obj2")
+
+        assert tagging_tasks.resync_object_tags_task([object_tag.pk]) == 1
+
+        assert self._cached_value(object_tag) == self.tag.value
+        assert self._cached_value(other_tag) == "stale value"  # not in the id filter
+
+    def test_full_runs_are_debounced(self):
+        """
+        A full run within the debounce window of another returns 0, even if
+        there is still something to resync.
+        """
+        self._make_stale_object_tag("obj1")
+        assert tagging_tasks.resync_object_tags_task() == 1
+
+        object_tag = self._make_stale_object_tag("obj2")
+        assert tagging_tasks.resync_object_tags_task() == 0
+        assert self._cached_value(object_tag) == "stale value"
+
+    def test_id_filtered_runs_ignore_the_lease(self):
+        """
+        Only full runs are debounced; id-filtered calls always do their work.
+        """
+        assert tagging_tasks.resync_object_tags_task() == 0  # takes the lease
+
+        object_tag = self._make_stale_object_tag("obj1")
+        assert tagging_tasks.resync_object_tags_task([object_tag.pk]) == 1
+
+    def test_lease_expires(self):
+        """
+        Once the debounce window passes, a full run does the table scan again.
+        """
+        self._make_stale_object_tag("obj1")
+        with patch.object(tagging_tasks, "RESYNC_DEBOUNCE_SECONDS", 0.05):
+            assert tagging_tasks.resync_object_tags_task() == 1
+
+            object_tag = self._make_stale_object_tag("obj2")
+            time.sleep(0.1)
+            assert tagging_tasks.resync_object_tags_task() == 1
+            assert self._cached_value(object_tag) == self.tag.value